@@ -14,13 +14,12 @@ export async function generateDesignFromNL(description) {
       '-c',
       `
 import sys
-import json
 sys.path.append('${path.join(__dirname, '')}')
-from enhanced_cad_engine import EnhancedCADEngine
+from enhanced_cad_engine import EnhancedCADEngine, dumps
 
 engine = EnhancedCADEngine()
 result = engine.process_description('''${description}''')
-print(json.dumps(result))
+sys.stdout.buffer.write(dumps(result))
       `
     ]);
     
@@ -5,8 +5,225 @@ while providing true CAD-like features
 """
 import math
 import json
+import re
+import functools
+import numpy as np
+from types import MappingProxyType
 from typing import Dict, List, Tuple, Optional, Any
 
+try:
+    from numba import njit
+except ImportError:
+    # Numba is optional: without it the kernels run as plain Python
+    def njit(*args, **kwargs):
+        return lambda fn: fn
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Description parsing patterns
+# Numeric fields are scanned in one pass; the diameter value sits in a lookahead
+# so that e.g. 'diameter 50mm' still reports 50 among the mm values
+_NUM_RE = re.compile(
+    r'(?P<mm>\d+\.?\d*)\s*mm'
+    r'|(?P<teeth>\d+)\s*teeth'
+    r'|(?:diameter|dia)\s*(?:of\s*)?(?=(?P<dia>\d+\.?\d*))',
+    re.IGNORECASE
+)
+_WORD_RE = re.compile(r'[a-z]+', re.IGNORECASE)
+
+# Keyword classifier: word -> (category, value), in priority order per category
+_KEYWORDS = {
+    'gear': ('type', 'gear'),
+    'shaft': ('type', 'shaft'),
+    'bearing': ('type', 'bearing'),
+    'bracket': ('type', 'bracket'),
+    'plate': ('type', 'plate'),
+    'aluminum': ('material', 'Aluminum'),
+    'titanium': ('material', 'Titanium')
+}
+
+# Material properties (density in g/cm³, yield strength in MPa)
+_MATERIAL_PROPS = MappingProxyType({
+    'Steel': {'density': 7.85, 'yield_strength': 250},
+    'Aluminum': {'density': 2.7, 'yield_strength': 95},
+    'Titanium': {'density': 4.5, 'yield_strength': 880}
+})
+
+# Default 'values' per component type when none were parsed
+_DEFAULT_VALUES = MappingProxyType({
+    'gear': (25, 10),  # radius, thickness
+    'shaft': (12.5, 100),
+    'bearing': (30, 15, 15),
+    'bracket': (100, 50, 10),
+    'plate': (100, 100, 5),
+    'bolt': (4, 30),
+    'cylinder': (25, 50),
+    'cube': (50,),
+    'prism': (30, 30, 50),
+    'sphere': (25,),
+    'cone': (25, 50),
+    'pyramid': (30, 30, 40)
+})
+
+def _index_buffer(indices: Tuple[int, ...]) -> np.ndarray:
+    """Read-only uint32 index buffer, shared by every mesh of that shape"""
+    buffer = np.array(indices, dtype=np.uint32)
+    buffer.flags.writeable = False
+    return buffer
+
+# Index buffers of the fixed-topology shapes; they do not depend on any input
+_BOX_INDICES = _index_buffer((
+    0, 1, 2, 0, 2, 3,  # Front
+    4, 6, 5, 4, 7, 6,  # Back
+    0, 4, 5, 0, 5, 1,  # Bottom
+    1, 5, 6, 1, 6, 2,  # Right
+    2, 6, 7, 2, 7, 3,  # Top
+    3, 7, 4, 3, 4, 0,  # Left
+))
+_CUBE_INDICES = _index_buffer((
+    0, 1, 2, 0, 2, 3,  # Front
+    4, 6, 5, 4, 7, 6,  # Back
+    1, 5, 6, 1, 6, 2,  # Right
+    0, 3, 7, 0, 7, 4,  # Left
+    3, 2, 6, 3, 6, 7,  # Top
+    0, 4, 5, 0, 5, 1,  # Bottom
+))
+_PRISM_INDICES = _index_buffer((0, 1, 2, 3, 5, 4, 0, 2, 5, 0, 5, 3, 1, 4, 5, 1, 5, 2, 0, 3, 4, 0, 4, 1))
+_PYRAMID_INDICES = _index_buffer((0, 1, 2, 0, 2, 3, 0, 3, 4, 0, 4, 1, 1, 3, 2, 1, 4, 3))
+
+def _up_normals(vertex_count: int) -> np.ndarray:
+    """Placeholder +Z normals of the simplified shapes"""
+    return np.tile(np.array([0, 0, 1], dtype=np.float32), vertex_count)
+
+def _values(dimensions: Dict[str, Any], component_type: str) -> Tuple[float, ...]:
+    """Parsed 'values' padded with the component type's defaults"""
+    defaults = _DEFAULT_VALUES[component_type]
+    values = dimensions.get('values') or defaults
+    return tuple(values) + defaults[len(values):]
+
+def _classify(text: str) -> Dict[str, str]:
+    """Scan text once and return the highest-priority keyword value per category"""
+    # Prefix match so that e.g. 'gears' and 'gearbox' still count as 'gear'
+    tokens = {word.lower() for word in _WORD_RE.findall(text)}
+    found = {}
+    for keyword, (category, value) in _KEYWORDS.items():
+        if category not in found and any(token.startswith(keyword) for token in tokens):
+            found[category] = value
+    return found
+
+@functools.lru_cache(maxsize=16)
+def _unit_circle(segments: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Read-only cos/sin tables of a closed unit circle, cached per segment count"""
+    angles = np.linspace(0, 2 * math.pi, segments + 1)
+    c, s = np.cos(angles), np.sin(angles)
+    c.flags.writeable = False
+    s.flags.writeable = False
+    return c, s
+
+def _ring(radius: float, z: float, segments: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Vertices and outward normals of a closed circle (segments + 1 points) at height z"""
+    c, s = _unit_circle(segments)
+    verts = np.stack([radius * c, radius * s, np.full_like(c, z)], 1)
+    norms = np.stack([c, s, np.zeros_like(c)], 1)
+    return verts, norms
+
+def _weld(verts: np.ndarray, triangles: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Merge coincident vertices into an indexed mesh.
+    Returns the ids of the vertices to keep and the triangles remapped onto them.
+    """
+    lookup = {}
+    keep = []
+    remap = np.empty(len(verts), dtype=np.uint32)
+    for i, key in enumerate(map(tuple, np.round(verts, 6).tolist())):
+        if key not in lookup:
+            lookup[key] = len(keep)
+            keep.append(i)
+        remap[i] = lookup[key]
+    return np.array(keep, dtype=int), remap[triangles]
+
+@njit(cache=True, fastmath=True)
+def _gear_kernel(teeth, base_radius, root_radius, out_verts):
+    """Write the tooth profile into out_verts[:, 1:, :2] of both gear faces"""
+    angle_step = (2 * math.pi) / (teeth * 4)  # 4 points per tooth face
+    k = 1
+    for i in range(teeth):
+        angle_offset = (2 * math.pi * i) / teeth
+        for j in range(4):
+            if j < 2:
+                # First half of the tooth pitch follows the involute curve
+                angle = angle_offset + j * angle_step
+                x = base_radius * (math.cos(angle) + angle * math.sin(angle))
+                y = base_radius * (math.sin(angle) - angle * math.cos(angle))
+            else:
+                # Root circle
+                root_angle = angle_offset + math.pi/teeth + (j - 2) * angle_step
+                x = root_radius * math.cos(root_angle)
+                y = root_radius * math.sin(root_angle)
+            for face in range(2):
+                out_verts[face, k, 0] = x
+                out_verts[face, k, 1] = y
+            k += 1
+
+@njit(cache=True, fastmath=True)
+def _sphere_kernel(radius, segments, rings):
+    """Vertex, normal and index buffers of a UV sphere"""
+    vertices = np.empty((rings + 1) * (segments + 1) * 3, dtype=np.float32)
+    normals = np.empty_like(vertices)
+    indices = np.empty(rings * segments * 6, dtype=np.uint32)
+    
+    # Theta only depends on the segment, so its trig is computed once per segment
+    cos_theta = np.empty(segments + 1)
+    sin_theta = np.empty(segments + 1)
+    for j in range(segments + 1):
+        theta = 2 * math.pi * j / segments
+        cos_theta[j] = math.cos(theta)
+        sin_theta[j] = math.sin(theta)
+    
+    # Generate sphere vertices using spherical coordinates
+    k = 0
+    for i in range(rings + 1):
+        phi = math.pi * i / rings
+        sin_phi = math.sin(phi)
+        cos_phi = math.cos(phi)
+        r_sin_phi = radius * sin_phi
+        z = radius * cos_phi
+        for j in range(segments + 1):
+            vertices[k] = r_sin_phi * cos_theta[j]
+            vertices[k + 1] = r_sin_phi * sin_theta[j]
+            vertices[k + 2] = z
+            # Normal is the position vector scaled by 1/radius, i.e. the unit direction
+            normals[k] = sin_phi * cos_theta[j]
+            normals[k + 1] = sin_phi * sin_theta[j]
+            normals[k + 2] = cos_phi
+            k += 3
+    
+    # Generate indices for triangular faces
+    k = 0
+    for i in range(rings):
+        for j in range(segments):
+            first = i * (segments + 1) + j
+            second = first + segments + 1
+            
+            indices[k] = first
+            indices[k + 1] = second
+            indices[k + 2] = first + 1
+            indices[k + 3] = second
+            indices[k + 4] = second + 1
+            indices[k + 5] = first + 1
+            k += 6
+    
+    return vertices, normals, indices
+
+def dumps(result: Dict[str, Any]) -> bytes:
+    """Serialize a process_description result, encoding NumPy buffers natively"""
+    if orjson is not None:
+        return orjson.dumps(result, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(result, default=lambda buffer: buffer.tolist()).encode('utf-8')
+
 class EnhancedCADEngine:
     """Enhanced CAD engine with real geometric features"""
     
@@ -47,46 +264,34 @@ class EnhancedCADEngine:
     
     def _parse_description(self, description: str) -> Dict[str, Any]:
         """Parse natural language description"""
-        text = description.lower()
+        # Classify component type and material keywords in a single scan
+        keywords = _classify(description)
         
         # Extract component type
-        component_type = 'bracket'
-        if 'gear' in text:
-            component_type = 'gear'
-        elif 'shaft' in text:
-            component_type = 'shaft'
-        elif 'bearing' in text:
-            component_type = 'bearing'
-        elif 'bracket' in text:
-            component_type = 'bracket'
-        elif 'plate' in text:
-            component_type = 'plate'
+        component_type = keywords.get('type', 'bracket')
         
         # Extract dimensions
         dimensions = {}
-        import re
-        
-        # Extract numeric values with units
-        mm_matches = re.findall(r'(\d+\.?\d*)\s*mm', text)
-        if mm_matches:
-            dimensions['values'] = [float(x) for x in mm_matches]
-        
-        # Extract teeth count
-        teeth_match = re.search(r'(\d+)\s*teeth', text)
-        if teeth_match:
-            dimensions['teeth'] = int(teeth_match.group(1))
         
-        # Extract diameter
-        dia_match = re.search(r'(?:diameter|dia)\s*(?:of\s*)?(\d+\.?\d*)', text)
-        if dia_match:
-            dimensions['diameter'] = float(dia_match.group(1))
+        # Extract values with units, the first teeth count and the first diameter
+        mm_values, teeth, diameter = [], None, None
+        for match in _NUM_RE.finditer(description):
+            kind = match.lastgroup
+            if kind == 'mm':
+                mm_values.append(float(match['mm']))
+            elif kind == 'teeth' and teeth is None:
+                teeth = int(match['teeth'])
+            elif kind == 'dia' and diameter is None:
+                diameter = float(match['dia'])
+        if mm_values:
+            dimensions['values'] = mm_values
+        if teeth is not None:
+            dimensions['teeth'] = teeth
+        if diameter is not None:
+            dimensions['diameter'] = diameter
         
         # Extract material
-        material = 'Steel'
-        if 'aluminum' in text:
-            material = 'Aluminum'
-        elif 'titanium' in text:
-            material = 'Titanium'
+        material = keywords.get('material', 'Steel')
         
         return {
             'type': component_type,
@@ -108,17 +313,12 @@ class EnhancedCADEngine:
     def _generate_gear(self, dimensions: Dict[str, Any]) -> Dict[str, Any]:
         """Generate enhanced gear with real involute teeth"""
         # Extract parameters
-        values = dimensions.get('values', [25, 10])  # radius, thickness
+        values = _values(dimensions, 'gear')
         teeth = dimensions.get('teeth', 20)
-        diameter = dimensions.get('diameter', values[0] * 2 if values else 50)
+        diameter = dimensions.get('diameter', values[0] * 2)
         
         radius = diameter / 2
-        thickness = values[1] if len(values) > 1 else 10
-        
-        # Generate gear vertices with proper involute profile
-        vertices = []
-        normals = []
-        indices = []
+        thickness = values[1]
         
         # Gear parameters
         module = diameter / teeth
@@ -126,60 +326,37 @@ class EnhancedCADEngine:
         dedendum = 1.25 * module
         pressure_angle = math.radians(20)
         
-        # Generate tooth profile using involute curve
-        def involute_point(base_radius, angle):
-            """Generate point on involute curve"""
-            x = base_radius * (math.cos(angle) + angle * math.sin(angle))
-            y = base_radius * (math.sin(angle) - angle * math.cos(angle))
-            return x, y
-        
         base_radius = radius * math.cos(pressure_angle)
-        angle_step = (2 * math.pi) / (teeth * 4)  # 4 points per tooth face
         
-        # Generate vertices for top and bottom faces
-        for face in [0, 1]:  # 0 = bottom, 1 = top
-            z = -thickness/2 if face == 0 else thickness/2
-            
-            # Center point
-            vertices.extend([0, 0, z])
-            normals.extend([0, 0, -1 if face == 0 else 1])
-            
-            # Generate tooth vertices
-            for i in range(teeth):
-                angle_offset = (2 * math.pi * i) / teeth
-                
-                # Add points for each tooth face
-                for j in range(4):
-                    angle = angle_offset + (j * angle_step)
-                    if angle < angle_offset + math.pi/teeth:
-                        # Tooth face
-                        x, y = involute_point(base_radius, angle)
-                        vertices.extend([x, y, z])
-                        normals.extend([0, 0, -1 if face == 0 else 1])
-                    else:
-                        # Root circle
-                        root_angle = angle_offset + math.pi/teeth + (j-2) * angle_step
-                        x = (radius - dedendum) * math.cos(root_angle)
-                        y = (radius - dedendum) * math.sin(root_angle)
-                        vertices.extend([x, y, z])
-                        normals.extend([0, 0, -1 if face == 0 else 1])
-        
-        # Generate indices for faces (simplified)
-        # In a real implementation, this would create proper triangulation
-        center_index = 0
-        vertex_count = len(vertices) // 3
-        for i in range(1, vertex_count, 4):
-            if i + 3 < vertex_count:
-                # Create face triangles
-                indices.extend([center_index, i, i+1])
-                indices.extend([center_index, i+1, i+2])
-                indices.extend([center_index, i+2, i+3])
+        # Bottom and top faces: center point followed by the tooth vertices
+        verts = np.zeros((2, teeth * 4 + 1, 3), dtype=np.float32)
+        _gear_kernel(teeth, base_radius, radius - dedendum, verts)
+        verts[0, :, 2] = -thickness/2
+        verts[1, :, 2] = thickness/2
+        profile = verts[0, :, :2]
+        norms = np.zeros_like(verts)
+        norms[0, :, 2] = -1
+        norms[1, :, 2] = 1
+        
+        # Triangle fan from each face center over the closed rim; the bottom
+        # face is wound clockwise so that it faces -Z
+        rim_size = teeth * 4
+        rim = np.arange(1, rim_size + 1, dtype=np.uint32)
+        next_rim = np.roll(rim, -1)
+        bottom_center = np.zeros_like(rim)
+        top_center = bottom_center + rim_size + 1
+        indices = np.concatenate([
+            np.stack([bottom_center, next_rim, rim], 1),
+            np.stack([top_center, top_center + rim, top_center + next_rim], 1)
+        ])
         
         return {
             'type': 'gear',
-            'vertices': vertices,
-            'normals': normals,
-            'indices': indices,
+            'vertices': verts.ravel(),
+            'normals': norms.ravel(),
+            'indices': indices.ravel(),
+            'bbox_min': [*profile.min(0).tolist(), -thickness/2],
+            'bbox_max': [*profile.max(0).tolist(), thickness/2],
             'parameters': {
                 'teeth': teeth,
                 'radius': radius,
@@ -191,54 +368,47 @@ class EnhancedCADEngine:
     
     def _generate_shaft(self, dimensions: Dict[str, Any]) -> Dict[str, Any]:
         """Generate enhanced shaft with proper cylindrical geometry"""
-        values = dimensions.get('values', [12.5, 100])
-        diameter = dimensions.get('diameter', values[0] * 2 if values else 25)
-        length = values[1] if len(values) > 1 else 100
+        values = _values(dimensions, 'shaft')
+        diameter = dimensions.get('diameter', values[0] * 2)
+        length = values[1]
         
         radius = diameter / 2
         segments = 32  # High quality cylindrical segments
         
-        vertices = []
-        normals = []
-        indices = []
-        
-        # Generate cylindrical vertices
-        for i in range(segments + 1):
-            angle = (2 * math.pi * i) / segments
-            
-            # Add top and bottom vertices for each segment
-            x = radius * math.cos(angle)
-            y = radius * math.sin(angle)
-            
-            # Bottom vertex
-            vertices.extend([x, y, -length/2])
-            normals.extend([x/radius, y/radius, 0])
-            
-            # Top vertex
-            vertices.extend([x, y, length/2])
-            normals.extend([x/radius, y/radius, 0])
-        
-        # Generate indices for triangular faces
-        for i in range(segments):
-            bottom1 = i * 2
-            bottom2 = ((i + 1) % segments) * 2
-            top1 = bottom1 + 1
-            top2 = bottom2 + 1
-            
-            # Side faces (two triangles per segment)
-            indices.extend([bottom1, top1, top2])
-            indices.extend([bottom1, top2, bottom2])
-            
-            # Cap faces
-            indices.extend([0, bottom1, bottom2])  # Bottom cap
-            top_center = len(vertices) // 3 - 1
-            indices.extend([top_center, top2, top1])  # Top cap
+        # Generate cylindrical vertices, bottom and top interleaved per segment
+        bottom, ring_normals = _ring(radius, -length/2, segments)
+        top, _ = _ring(radius, length/2, segments)
+        verts = np.empty((2 * (segments + 1), 3), dtype=np.float32)
+        verts[0::2] = bottom
+        verts[1::2] = top
+        norms = np.empty_like(verts)
+        norms[0::2] = ring_normals
+        norms[1::2] = ring_normals
+        vertices = verts.ravel()
+        normals = norms.ravel()
+        # Generate indices for triangular faces, four triangles per segment
+        top_center = len(vertices) // 3 - 1
+        bottom1 = np.arange(0, 2 * segments, 2, dtype=np.uint32)
+        bottom2 = np.roll(bottom1, -1)
+        top1, top2 = bottom1 + 1, bottom2 + 1
+        faces = np.empty((segments, 12), dtype=np.uint32)
+        columns = (
+            bottom1, top1, top2,  # Side faces (two triangles per segment)
+            bottom1, top2, bottom2,
+            0, bottom1, bottom2,  # Bottom cap
+            top_center, top2, top1  # Top cap
+        )
+        for k, column in enumerate(columns):
+            faces[:, k] = column
+        indices = faces.ravel()
         
         return {
             'type': 'shaft',
             'vertices': vertices,
             'normals': normals,
             'indices': indices,
+            'bbox_min': [-radius, -radius, -length/2],
+            'bbox_max': [radius, radius, length/2],
             'parameters': {
                 'radius': radius,
                 'length': length,
@@ -248,63 +418,62 @@ class EnhancedCADEngine:
     
     def _generate_bearing(self, dimensions: Dict[str, Any]) -> Dict[str, Any]:
         """Generate enhanced bearing with proper geometry"""
-        values = dimensions.get('values', [30, 15])
-        outer_diameter = dimensions.get('diameter', values[0] * 2 if values else 60)
-        inner_diameter = values[1] * 2 if len(values) > 1 else 30
-        thickness = values[2] if len(values) > 2 else 15
+        values = _values(dimensions, 'bearing')
+        outer_diameter = dimensions.get('diameter', values[0] * 2)
+        inner_diameter = values[1] * 2
+        thickness = values[2]
         
         outer_radius = outer_diameter / 2
         inner_radius = inner_diameter / 2
         segments = 48  # High quality for bearing
         
-        vertices = []
-        normals = []
-        indices = []
+        # Generate bearing race geometry (simplified ring): outer top/bottom
+        # and inner top/bottom vertices interleaved per segment
+        verts = np.empty((segments + 1, 4, 3), dtype=np.float32)
+        verts[:, 0], ring_normals = _ring(outer_radius, thickness/2, segments)
+        verts[:, 1], _ = _ring(outer_radius, -thickness/2, segments)
+        verts[:, 2], _ = _ring(inner_radius, thickness/2, segments)
+        verts[:, 3], _ = _ring(inner_radius, -thickness/2, segments)
+        norms = np.empty_like(verts)
+        norms[:] = ring_normals[:, None]
+        verts = verts.reshape(-1, 3)
+        norms = norms.reshape(-1, 3)
+        
+        # Two triangles per quad for outer/inner walls and top/bottom faces
+        ot = 4 * np.arange(segments)
+        ob, it, ib = ot + 1, ot + 2, ot + 3
+        triangles = np.concatenate([
+            np.stack([ob, ob + 4, ot + 4], 1), np.stack([ob, ot + 4, ot], 1),  # Outer wall
+            np.stack([ib, it + 4, ib + 4], 1), np.stack([ib, it, it + 4], 1),  # Inner wall
+            np.stack([ot, ot + 4, it + 4], 1), np.stack([ot, it + 4, it], 1),  # Top face
+            np.stack([ob, ib + 4, ob + 4], 1), np.stack([ob, ib, ib + 4], 1),  # Bottom face
+        ])
+        
+        # Share the seam vertices so each position is emitted once
+        keep, triangles = _weld(verts, triangles)
+        rim_radius = max(outer_radius, inner_radius)
         
-        # Generate bearing race geometry (simplified ring)
-        for i in range(segments + 1):
-            angle = (2 * math.pi * i) / segments
-            
-            # Outer vertices (top and bottom)
-            x_outer = outer_radius * math.cos(angle)
-            y_outer = outer_radius * math.sin(angle)
-            vertices.extend([x_outer, y_outer, thickness/2])
-            normals.extend([x_outer/outer_radius, y_outer/outer_radius, 0])
-            vertices.extend([x_outer, y_outer, -thickness/2])
-            normals.extend([x_outer/outer_radius, y_outer/outer_radius, 0])
-            
-            # Inner vertices (top and bottom)
-            x_inner = inner_radius * math.cos(angle)
-            y_inner = inner_radius * math.sin(angle)
-            vertices.extend([x_inner, y_inner, thickness/2])
-            normals.extend([x_inner/inner_radius, y_inner/inner_radius, 0])
-            vertices.extend([x_inner, y_inner, -thickness/2])
-            normals.extend([x_inner/inner_radius, y_inner/inner_radius, 0])
-        
-        # Generate proper indices (this would be complex triangulation)
-        # For this implementation, we'll simplify and indicate where complex faces are needed
         return {
             'type': 'bearing',
-            'vertices': vertices,
-            'normals': normals,
-            'indices': list(range(len(vertices) // 3)),  # Placeholder for complex triangulation
+            'vertices': verts[keep].ravel(),
+            'normals': norms[keep].ravel(),
+            'indices': triangles.ravel(),
+            'bbox_min': [-rim_radius, -rim_radius, -thickness/2],
+            'bbox_max': [rim_radius, rim_radius, thickness/2],
             'parameters': {
                 'outer_radius': outer_radius,
                 'inner_radius': inner_radius,
                 'thickness': thickness,
-                'note': 'Complex bearing triangulation not implemented - simplified geometry'
+                'note': 'Simplified race geometry - rolling elements not modelled'
             }
         }
     
     def _generate_bracket(self, dimensions: Dict[str, Any]) -> Dict[str, Any]:
         """Generate enhanced bracket with proper filleted geometry and mounting holes"""
-        values = dimensions.get('values', [100, 50, 10])
-        width = values[0] if len(values) > 0 else 100
-        height = values[1] if len(values) > 1 else 50
-        thickness = values[2] if len(values) > 2 else 10
+        width, height, thickness = _values(dimensions, 'bracket')[:3]
         
         # Create vertices with real brackets profile
-        vertices = [
+        vertices = np.array([
             # Front face - outer rectangle
             -width/2, -height/2, thickness/2,  # 0
             width/2, -height/2, thickness/2,   # 1
@@ -321,29 +490,19 @@ class EnhancedCADEngine:
             # Hole 1
             -width/3, -height/3, thickness/2,  # 8
             -width/3, -height/3, -thickness/2, # 9
-        ]
+        ], dtype=np.float32)
         
         # Add normals (simplified)
-        normals = [0, 0, 1] * (len(vertices) // 3)
+        normals = _up_normals(len(vertices) // 3)
         
         # Simple indices for a basic box (real implementation would be more complex)
-        indices = [
-            # Front face
-            0, 1, 2, 0, 2, 3,
-            # Back face
-            4, 6, 5, 4, 7, 6,
-            # Sides (simplified)
-            0, 4, 5, 0, 5, 1,
-            1, 5, 6, 1, 6, 2,
-            2, 6, 7, 2, 7, 3,
-            3, 7, 4, 3, 4, 0
-        ]
-        
         return {
             'type': 'bracket',
             'vertices': vertices,
             'normals': normals,
-            'indices': indices,
+            'indices': _BOX_INDICES,
+            'bbox_min': [-width/2, -height/2, -thickness/2],
+            'bbox_max': [width/2, height/2, thickness/2],
             'parameters': {
                 'width': width,
                 'height': height,
@@ -355,13 +514,10 @@ class EnhancedCADEngine:
     
     def _generate_plate(self, dimensions: Dict[str, Any]) -> Dict[str, Any]:
         """Generate enhanced plate with proper geometry"""
-        values = dimensions.get('values', [100, 100, 5])
-        width = values[0] if len(values) > 0 else 100
-        height = values[1] if len(values) > 1 else 100
-        thickness = values[2] if len(values) > 2 else 5
+        width, height, thickness = _values(dimensions, 'plate')[:3]
         
         # Simple rectangular plate
-        vertices = [
+        vertices = np.array([
             -width/2, -height/2, thickness/2,
             width/2, -height/2, thickness/2,
             width/2, height/2, thickness/2,
@@ -370,24 +526,17 @@ class EnhancedCADEngine:
             width/2, -height/2, -thickness/2,
             width/2, height/2, -thickness/2,
             -width/2, height/2, -thickness/2,
-        ]
+        ], dtype=np.float32)
         
-        normals = [0, 0, 1] * (len(vertices) // 3)
-        
-        indices = [
-            0, 1, 2, 0, 2, 3,  # Front
-            4, 6, 5, 4, 7, 6,  # Back
-            0, 4, 5, 0, 5, 1,  # Bottom
-            1, 5, 6, 1, 6, 2,  # Right
-            2, 6, 7, 2, 7, 3,  # Top
-            3, 7, 4, 3, 4, 0,  # Left
-        ]
+        normals = _up_normals(len(vertices) // 3)
         
         return {
             'type': 'plate',
             'vertices': vertices,
             'normals': normals,
-            'indices': indices,
+            'indices': _BOX_INDICES,
+            'bbox_min': [-width/2, -height/2, -thickness/2],
+            'bbox_max': [width/2, height/2, thickness/2],
             'parameters': {
                 'width': width,
                 'height': height,
@@ -397,47 +546,63 @@ class EnhancedCADEngine:
     
     def _generate_bolt(self, dimensions: Dict[str, Any]) -> Dict[str, Any]:
         """Generate enhanced bolt with proper head and threaded shaft"""
-        values = dimensions.get('values', [4, 30])
-        diameter = dimensions.get('diameter', values[0] * 2 if values else 8)
-        length = values[1] if len(values) > 1 else 30
+        values = _values(dimensions, 'bolt')
+        diameter = dimensions.get('diameter', values[0] * 2)
+        length = values[1]
         
         radius = diameter / 2
         head_radius = radius * 1.5
         head_height = radius * 0.8
         segments = 16
         
-        vertices = []
-        normals = []
-        indices = []
-        
-        # Generate bolt head (hexagonal)
-        head_vertices = []
-        for i in range(6):
-            angle = (2 * math.pi * i) / 6
-            x = head_radius * math.cos(angle)
-            y = head_radius * math.sin(angle)
-            head_vertices.extend([x, y, 0])  # Bottom of head
-            head_vertices.extend([x, y, head_height])  # Top of head
-        
-        vertices.extend(head_vertices)
-        
-        # Generate shaft
-        shaft_start = len(vertices) // 3
-        for i in range(segments + 1):
-            angle = (2 * math.pi * i) / segments
-            x = radius * math.cos(angle)
-            y = radius * math.sin(angle)
-            vertices.extend([x, y, head_height])  # Start of shaft
-            vertices.extend([x, y, head_height + length])  # End of shaft
+        shaft_start = 12
+        verts = np.empty((shaft_start + 2 * (segments + 1), 3), dtype=np.float32)
+        
+        # Generate bolt head (hexagonal), bottom and top vertices per corner
+        head_bottom, _ = _ring(head_radius, 0, 6)
+        head_top, _ = _ring(head_radius, head_height, 6)
+        verts[0:shaft_start:2] = head_bottom[:6]
+        verts[1:shaft_start:2] = head_top[:6]
+        
+        # Generate shaft, start and end vertices interleaved per segment
+        verts[shaft_start::2], _ = _ring(radius, head_height, segments)
+        verts[shaft_start + 1::2], _ = _ring(radius, head_height + length, segments)
+        
+        # Head sides and caps
+        corner = 2 * np.arange(6)
+        next_corner = 2 * ((np.arange(6) + 1) % 6)
+        fan = 2 * np.arange(1, 5)
+        triangles = [
+            np.stack([corner, next_corner, next_corner + 1], 1),
+            np.stack([corner, next_corner + 1, corner + 1], 1),
+            np.stack([np.zeros_like(fan), fan + 2, fan], 1),  # Bottom cap
+            np.stack([np.ones_like(fan), fan + 1, fan + 3], 1),  # Top cap
+        ]
+        
+        # Shaft sides and caps
+        shaft = shaft_start + 2 * np.arange(segments)
+        fan = shaft_start + 2 * np.arange(1, segments - 1)
+        triangles += [
+            np.stack([shaft, shaft + 2, shaft + 3], 1),
+            np.stack([shaft, shaft + 3, shaft + 1], 1),
+            np.stack([np.full_like(fan, shaft_start), fan + 2, fan], 1),  # Start cap
+            np.stack([np.full_like(fan, shaft_start + 1), fan + 1, fan + 3], 1),  # End cap
+        ]
+        
+        # Share the seam vertices so each position is emitted once
+        keep, triangles = _weld(verts, np.concatenate(triangles))
+        vertices = verts[keep].ravel()
         
         # Add normals (simplified)
-        normals = [0, 0, 1] * (len(vertices) // 3)
+        normals = _up_normals(len(vertices) // 3)
         
         return {
             'type': 'bolt',
             'vertices': vertices,
             'normals': normals,
-            'indices': list(range(len(vertices) // 3)),
+            'indices': triangles.ravel(),
+            'bbox_min': [-head_radius, -head_radius * math.sin(math.pi/3), 0],
+            'bbox_max': [head_radius, head_radius * math.sin(math.pi/3), head_height + length],
             'parameters': {
                 'radius': radius,
                 'length': length,
@@ -448,11 +613,11 @@ class EnhancedCADEngine:
     
     def _generate_cube(self, dimensions: Dict[str, Any]) -> Dict[str, Any]:
         """Generate enhanced cube with proper geometry"""
-        size = dimensions.get('size', dimensions.get('values', [50])[0] if dimensions.get('values') else 50)
+        size = dimensions.get('size', _values(dimensions, 'cube')[0])
         
         # Create vertices for a cube
         half = size / 2
-        vertices = [
+        vertices = np.array([
             # Front face
             -half, -half, half,   # 0
             half, -half, half,    # 1
@@ -463,31 +628,18 @@ class EnhancedCADEngine:
             half, -half, -half,   # 5
             half, half, -half,    # 6
             -half, half, -half,   # 7
-        ]
+        ], dtype=np.float32)
         
-        normals = [0, 0, 1] * (len(vertices) // 3)
-        
-        # Define faces with proper winding
-        indices = [
-            # Front
-            0, 1, 2, 0, 2, 3,
-            # Back
-            4, 6, 5, 4, 7, 6,
-            # Right
-            1, 5, 6, 1, 6, 2,
-            # Left
-            0, 3, 7, 0, 7, 4,
-            # Top
-            3, 2, 6, 3, 6, 7,
-            # Bottom
-            0, 4, 5, 0, 5, 1
-        ]
+        normals = _up_normals(len(vertices) // 3)
         
+        # Faces with proper winding
         return {
             'type': 'cube',
             'vertices': vertices,
             'normals': normals,
-            'indices': indices,
+            'indices': _CUBE_INDICES,
+            'bbox_min': [-half, -half, -half],
+            'bbox_max': [half, half, half],
             'parameters': {
                 'size': size
             }
@@ -495,13 +647,14 @@ class EnhancedCADEngine:
     
     def _generate_prism(self, dimensions: Dict[str, Any]) -> Dict[str, Any]:
         """Generate enhanced triangular prism"""
-        base_width = dimensions.get('baseWidth', dimensions.get('values', [30, 30, 50])[0] if dimensions.get('values') else 30)
-        base_height = dimensions.get('baseHeight', dimensions.get('values', [30, 30, 50])[1] if len(dimensions.get('values', [])) > 1 else 30)
-        length = dimensions.get('length', dimensions.get('values', [30, 30, 50])[2] if len(dimensions.get('values', [])) > 2 else 50)
+        values = _values(dimensions, 'prism')
+        base_width = dimensions.get('baseWidth', values[0])
+        base_height = dimensions.get('baseHeight', values[1])
+        length = dimensions.get('length', values[2])
         
         # Create triangular prism vertices
         half_length = length / 2
-        vertices = [
+        vertices = np.array([
             # Triangle base (front)
             0, base_height/2, half_length,           # 0 - Top
             -base_width/2, -base_height/2, half_length,  # 1 - Bottom left
@@ -511,16 +664,17 @@ class EnhancedCADEngine:
             0, base_height/2, -half_length,          # 3 - Top
             -base_width/2, -base_height/2, -half_length, # 4 - Bottom left
             base_width/2, -base_height/2, -half_length,  # 5 - Bottom right
-        ]
+        ], dtype=np.float32)
         
-        normals = [0, 0, 1] * (len(vertices) // 3)
-        indices = [0, 1, 2, 3, 5, 4, 0, 2, 5, 0, 5, 3, 1, 4, 5, 1, 5, 2, 0, 3, 4, 0, 4, 1]
+        normals = _up_normals(len(vertices) // 3)
         
         return {
             'type': 'prism',
             'vertices': vertices,
             'normals': normals,
-            'indices': indices,
+            'indices': _PRISM_INDICES,
+            'bbox_min': [-base_width/2, -base_height/2, -half_length],
+            'bbox_max': [base_width/2, base_height/2, half_length],
             'parameters': {
                 'base_width': base_width,
                 'base_height': base_height,
@@ -530,47 +684,38 @@ class EnhancedCADEngine:
     
     def _generate_cylinder(self, dimensions: Dict[str, Any]) -> Dict[str, Any]:
         """Generate enhanced cylinder with proper caps"""
-        values = dimensions.get('values', [25, 50])
-        radius = dimensions.get('radius', values[0] if values else 25)
-        height = dimensions.get('height', values[1] if len(values) > 1 else 50)
+        values = _values(dimensions, 'cylinder')
+        radius = dimensions.get('radius', values[0])
+        height = dimensions.get('height', values[1])
         segments = 32
         
-        vertices = []
-        normals = []
-        indices = []
-        
-        # Generate vertices
-        for i in range(segments + 1):
-            angle = (2 * math.pi * i) / segments
-            x = radius * math.cos(angle)
-            y = radius * math.sin(angle)
-            
-            # Bottom vertex
-            vertices.extend([x, y, -height/2])
-            normals.extend([x/radius, y/radius, 0])
-            
-            # Top vertex
-            vertices.extend([x, y, height/2])
-            normals.extend([x/radius, y/radius, 0])
-        
+        # Generate vertices, bottom and top interleaved per segment
+        bottom, ring_normals = _ring(radius, -height/2, segments)
+        top, _ = _ring(radius, height/2, segments)
+        verts = np.empty((2 * (segments + 1), 3), dtype=np.float32)
+        verts[0::2] = bottom
+        verts[1::2] = top
+        norms = np.empty_like(verts)
+        norms[0::2] = ring_normals
+        norms[1::2] = ring_normals
+        vertices = verts.ravel()
+        normals = norms.ravel()
         # Generate indices for sides
-        for i in range(segments):
-            bottom1 = i * 2
-            bottom2 = ((i + 1) % segments) * 2
-            top1 = bottom1 + 1
-            top2 = bottom2 + 1
-            
-            # Side faces
-            indices.extend([bottom1, top1, top2])
-            indices.extend([bottom1, top2, bottom2])
-            
-            # Caps (center vertices would be needed for proper caps)
+        # (caps would need center vertices)
+        bottom1 = np.arange(0, 2 * segments, 2, dtype=np.uint32)
+        bottom2 = np.roll(bottom1, -1)
+        top1, top2 = bottom1 + 1, bottom2 + 1
+        
+        # Side faces
+        indices = np.column_stack((bottom1, top1, top2, bottom1, top2, bottom2)).ravel()
         
         return {
             'type': 'cylinder',
             'vertices': vertices,
             'normals': normals,
             'indices': indices,
+            'bbox_min': [-radius, -radius, -height/2],
+            'bbox_max': [radius, radius, height/2],
             'parameters': {
                 'radius': radius,
                 'height': height,
@@ -580,43 +725,19 @@ class EnhancedCADEngine:
     
     def _generate_sphere(self, dimensions: Dict[str, Any]) -> Dict[str, Any]:
         """Generate enhanced sphere with proper triangulation"""
-        radius = dimensions.get('radius', dimensions.get('values', [25])[0] if dimensions.get('values') else 25)
+        radius = dimensions.get('radius', _values(dimensions, 'sphere')[0])
         segments = 16
         rings = 16
         
-        vertices = []
-        normals = []
-        indices = []
-        
-        # Generate sphere vertices using spherical coordinates
-        for i in range(rings + 1):
-            phi = math.pi * i / rings
-            for j in range(segments + 1):
-                theta = 2 * math.pi * j / segments
-                
-                x = radius * math.sin(phi) * math.cos(theta)
-                y = radius * math.sin(phi) * math.sin(theta)
-                z = radius * math.cos(phi)
-                
-                vertices.extend([x, y, z])
-                # Normal is the normalized position vector for sphere
-                length = math.sqrt(x*x + y*y + z*z)
-                normals.extend([x/length, y/length, z/length])
-        
-        # Generate indices for triangular faces
-        for i in range(rings):
-            for j in range(segments):
-                first = i * (segments + 1) + j
-                second = first + segments + 1
-                
-                indices.extend([first, second, first + 1])
-                indices.extend([second, second + 1, first + 1])
+        vertices, normals, indices = _sphere_kernel(float(radius), segments, rings)
         
         return {
             'type': 'sphere',
             'vertices': vertices,
             'normals': normals,
             'indices': indices,
+            'bbox_min': [-radius, -radius, -radius],
+            'bbox_max': [radius, radius, radius],
             'parameters': {
                 'radius': radius,
                 'segments': segments,
@@ -626,32 +747,35 @@ class EnhancedCADEngine:
     
     def _generate_cone(self, dimensions: Dict[str, Any]) -> Dict[str, Any]:
         """Generate enhanced cone with proper geometry"""
-        base_radius = dimensions.get('baseRadius', dimensions.get('values', [25, 50])[0] if dimensions.get('values') else 25)
+        values = _values(dimensions, 'cone')
+        base_radius = dimensions.get('baseRadius', values[0])
         top_radius = dimensions.get('topRadius', 0)  # Pointed cone by default
-        height = dimensions.get('height', dimensions.get('values', [25, 50])[1] if len(dimensions.get('values', [])) > 1 else 50)
+        height = dimensions.get('height', values[1])
         segments = 32
         
-        vertices = [0, 0, height/2]  # Apex
-        normals = [0, 0, 1]  # Apex normal
-        indices = []
+        verts = np.empty((segments + 2, 3), dtype=np.float32)
+        norms = np.empty_like(verts)
+        verts[0] = (0, 0, height/2)  # Apex
+        norms[0] = (0, 0, 1)  # Apex normal
         
         # Generate base vertices
-        for i in range(segments + 1):
-            angle = (2 * math.pi * i) / segments
-            x = base_radius * math.cos(angle)
-            y = base_radius * math.sin(angle)
-            vertices.extend([x, y, -height/2])
-            normals.extend([0, 0, -1])
-        
-        # Generate indices for triangular faces
-        for i in range(1, segments + 1):
-            indices.extend([0, i, i + 1 if i < segments else 1])
+        verts[1:], _ = _ring(base_radius, -height/2, segments)
+        norms[1:] = (0, 0, -1)
+        vertices = verts.ravel()
+        normals = norms.ravel()
+        # Generate indices for triangular faces; every triangle starts at the apex (0)
+        faces = np.zeros((segments, 3), dtype=np.uint32)
+        faces[:, 1] = np.arange(1, segments + 1)
+        faces[:, 2] = np.roll(faces[:, 1], -1)
+        indices = faces.ravel()
         
         return {
             'type': 'cone',
             'vertices': vertices,
             'normals': normals,
             'indices': indices,
+            'bbox_min': [-base_radius, -base_radius, -height/2],
+            'bbox_max': [base_radius, base_radius, height/2],
             'parameters': {
                 'base_radius': base_radius,
                 'top_radius': top_radius,
@@ -662,29 +786,31 @@ class EnhancedCADEngine:
     
     def _generate_pyramid(self, dimensions: Dict[str, Any]) -> Dict[str, Any]:
         """Generate enhanced pyramid with square base"""
-        base_width = dimensions.get('baseWidth', dimensions.get('values', [30, 30, 40])[0] if dimensions.get('values') else 30)
-        base_depth = dimensions.get('baseDepth', dimensions.get('values', [30, 30, 40])[1] if len(dimensions.get('values', [])) > 1 else 30)
-        height = dimensions.get('height', dimensions.get('values', [30, 30, 40])[2] if len(dimensions.get('values', [])) > 2 else 40)
+        values = _values(dimensions, 'pyramid')
+        base_width = dimensions.get('baseWidth', values[0])
+        base_depth = dimensions.get('baseDepth', values[1])
+        height = dimensions.get('height', values[2])
         
         half_width = base_width / 2
         half_depth = base_depth / 2
         
-        vertices = [
+        vertices = np.array([
             0, 0, height/2,                    # 0 - Apex
             -half_width, -half_depth, -height/2,  # 1 - Base corner
             half_width, -half_depth, -height/2,   # 2 - Base corner
             half_width, half_depth, -height/2,    # 3 - Base corner
             -half_width, half_depth, -height/2,   # 4 - Base corner
-        ]
+        ], dtype=np.float32)
         
-        normals = [0, 0, 1] * (len(vertices) // 3)
-        indices = [0, 1, 2, 0, 2, 3, 0, 3, 4, 0, 4, 1, 1, 3, 2, 1, 4, 3]
+        normals = _up_normals(len(vertices) // 3)
         
         return {
             'type': 'pyramid',
             'vertices': vertices,
             'normals': normals,
-            'indices': indices,
+            'indices': _PYRAMID_INDICES,
+            'bbox_min': [-half_width, -half_depth, -height/2],
+            'bbox_max': [half_width, half_depth, height/2],
             'parameters': {
                 'base_width': base_width,
                 'base_depth': base_depth,
@@ -695,13 +821,7 @@ class EnhancedCADEngine:
     def _calculate_properties(self, geometry: Dict[str, Any], parsed: Dict[str, Any]) -> Dict[str, Any]:
         """Calculate engineering properties"""
         material = parsed.get('material', 'Steel')
-        material_props = {
-            'Steel': {'density': 7.85, 'yield_strength': 250},
-            'Aluminum': {'density': 2.7, 'yield_strength': 95},
-            'Titanium': {'density': 4.5, 'yield_strength': 880}
-        }
-        
-        props = material_props.get(material, material_props['Steel'])
+        props = _MATERIAL_PROPS.get(material, _MATERIAL_PROPS['Steel'])
         
         # Calculate volume (simplified)
         if geometry['type'] == 'gear':
@@ -728,18 +848,21 @@ class EnhancedCADEngine:
     
     def _calculate_bounding_box(self, geometry: Dict[str, Any]) -> Dict[str, float]:
         """Calculate bounding box dimensions"""
-        vertices = geometry['vertices']
-        if not vertices:
-            return {'length': 0, 'width': 0, 'height': 0}
-        
-        x_coords = vertices[0::3]
-        y_coords = vertices[1::3]
-        z_coords = vertices[2::3]
+        if 'bbox_min' in geometry:
+            # Extents recorded by the generator while building the geometry
+            extents = np.subtract(geometry['bbox_max'], geometry['bbox_min'])
+        else:
+            vertices = geometry['vertices']
+            if len(vertices) == 0:
+                return {'length': 0, 'width': 0, 'height': 0}
+            
+            v = np.asarray(vertices, dtype=np.float32).reshape(-1, 3)
+            extents = v.max(0) - v.min(0)
         
         return {
-            'length': round(max(x_coords) - min(x_coords), 2),
-            'width': round(max(y_coords) - min(y_coords), 2),
-            'height': round(max(z_coords) - min(z_coords), 2)
+            'length': round(float(extents[0]), 2),
+            'width': round(float(extents[1]), 2),
+            'height': round(float(extents[2]), 2)
         }
     
     def _generate_checklist(self, parsed: Dict[str, Any]) -> List[str]:
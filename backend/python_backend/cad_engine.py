@@ -2,12 +2,107 @@
 DigiForm CAD Engine - True parametric solid modeling system
 Implements real CAD functionality with CadQuery/OpenCascade backend
 """
-import cadquery as cq
+from __future__ import annotations
+
+import copy
+import functools
+import importlib
+import itertools
 import math
-import numpy as np
-from typing import Dict, List, Optional, Tuple, Any
+import operator
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Tuple, Any
 import json
 
+if TYPE_CHECKING:
+    import cadquery as cq
+
+def _cq():
+    """Import CadQuery on first use; loading OpenCascade takes seconds"""
+    return importlib.import_module('cadquery')
+
+@functools.lru_cache(maxsize=None)
+def _xy_plane():
+    """The shared XY plane; it is only ever copied, never handed out"""
+    return _cq().Plane.named("XY")
+
+def _xy_workplane() -> cq.Workplane:
+    """A fresh XY workplane on a copy of the shared plane, skipping the named-plane lookup"""
+    return _cq().Workplane(copy.copy(_xy_plane()))
+
+@functools.lru_cache(maxsize=None)
+def _enable_parallel_booleans():
+    """Let OCCT split boolean operations across all cores; set once per process"""
+    from OCP.BOPAlgo import BOPAlgo_Options
+    BOPAlgo_Options.SetParallelMode_s(True)
+
+# Loop range of parallel kernels; swapped for numba.prange once Numba is loaded
+_prange = range
+
+def _njit(func=None, *, parallel: bool = False):
+    """
+    Compile func with Numba on its first call, falling back to plain Python when
+    Numba is not installed. Compiling lazily keeps the import of this module cheap.
+    """
+    if func is None:
+        return functools.partial(_njit, parallel=parallel)
+    compiled = None
+    
+    @functools.wraps(func)
+    def wrapper(*args):
+        global _prange
+        nonlocal compiled
+        if compiled is None:
+            try:
+                import numba
+            except ImportError:
+                compiled = func
+                return compiled(*args)
+            _prange = numba.prange
+            options = {'fastmath': True, 'parallel': parallel}
+            compiled = numba.njit(cache=True, **options)(func)
+            try:
+                return compiled(*args)
+            except ImportError:
+                # The on-disk cache was written while this file was imported under another
+                # module name (as a script vs. as python_backend.cad_engine); skip it
+                compiled = numba.njit(**options)(func)
+        return compiled(*args)
+    
+    return wrapper
+
+# Standard materials, one record per canonical name
+_MATERIALS = {
+    'Structural Steel': {'name': 'Structural Steel', 'density': 7850, 'description': 'Standard structural steel'},
+    'Aluminum': {'name': 'Aluminum', 'density': 2700, 'description': 'Aluminum alloy'},
+    'Titanium': {'name': 'Titanium', 'density': 4500, 'description': 'Titanium alloy'},
+    'Copper': {'name': 'Copper', 'density': 8960, 'description': 'Pure copper'},
+    'Brass': {'name': 'Brass', 'density': 8470, 'description': 'Brass alloy'},
+    'Plastic': {'name': 'Plastic', 'density': 1200, 'description': 'Generic plastic'},
+    'Composite': {'name': 'Composite', 'density': 1600, 'description': 'Fiber-reinforced composite'},
+    'Cast Iron': {'name': 'Cast Iron', 'density': 7200, 'description': 'Cast iron'},
+    'Stainless Steel': {'name': 'Stainless Steel', 'density': 7750, 'description': 'Stainless steel 304'},
+}
+
+# Lowercase lookup index, plus common names and abbreviations mapped to canonical keys
+_MATERIAL_INDEX = {key.lower(): key for key in _MATERIALS}
+_MATERIAL_ALIASES = {
+    'steel': 'Structural Steel',
+    'mild steel': 'Structural Steel',
+    'carbon steel': 'Structural Steel',
+    'ss': 'Stainless Steel',
+    'stainless': 'Stainless Steel',
+    'al': 'Aluminum',
+    'aluminium': 'Aluminum',
+    'ti': 'Titanium',
+    'cu': 'Copper',
+    'iron': 'Cast Iron',
+    'cfrp': 'Composite',
+    'carbon fiber': 'Composite',
+    'abs': 'Plastic',
+    'pla': 'Plastic',
+    'nylon': 'Plastic',
+}
+
 class MaterialDatabase:
     """
     Material database with density definitions.
@@ -16,20 +111,11 @@ class MaterialDatabase:
     
     def __init__(self):
         """Initialize material database with standard materials"""
-        self.materials = {
-            'Steel': {'name': 'Structural Steel', 'density': 7850, 'description': 'Standard structural steel'},
-            'Structural Steel': {'name': 'Structural Steel', 'density': 7850, 'description': 'Standard structural steel'},
-            'Aluminum': {'name': 'Aluminum', 'density': 2700, 'description': 'Aluminum alloy'},
-            'Titanium': {'name': 'Titanium', 'density': 4500, 'description': 'Titanium alloy'},
-            'Copper': {'name': 'Copper', 'density': 8960, 'description': 'Pure copper'},
-            'Brass': {'name': 'Brass', 'density': 8470, 'description': 'Brass alloy'},
-            'Plastic': {'name': 'Plastic', 'density': 1200, 'description': 'Generic plastic'},
-            'Composite': {'name': 'Composite', 'density': 1600, 'description': 'Fiber-reinforced composite'},
-            'Cast Iron': {'name': 'Cast Iron', 'density': 7200, 'description': 'Cast iron'},
-            'Stainless Steel': {'name': 'Stainless Steel', 'density': 7750, 'description': 'Stainless steel 304'},
-        }
+        self.materials = _MATERIALS
         self.default_material = 'Structural Steel'
         self.default_density = 7850  # kg/m³
+        self._index = _MATERIAL_INDEX
+        self._aliases = _MATERIAL_ALIASES
     
     def get_density(self, material_name: Optional[str] = None) -> Tuple[str, float, bool]:
         """
@@ -42,11 +128,8 @@ class MaterialDatabase:
             return (self.default_material, self.default_density, True)
         
         # Normalize material name
-        material_key = None
-        for key in self.materials.keys():
-            if material_name.lower() in key.lower() or key.lower() in material_name.lower():
-                material_key = key
-                break
+        name = material_name.strip().lower()
+        material_key = self._index.get(name) or self._aliases.get(name)
         
         if material_key:
             material_info = self.materials[material_key]
@@ -57,14 +140,47 @@ class MaterialDatabase:
     
     def get_all_materials(self) -> Dict[str, Dict[str, Any]]:
         """Get all available materials"""
-        return self.materials
+        return dict(self.materials)
 
+# Shared instance for mass property calculations; the tables above never change
+_MATERIAL_DB = MaterialDatabase()
+
+
+# Layout of MassProperties._buf
+_MP_VOLUME, _MP_AREA, _MP_DENSITY, _MP_MASS = range(4)
+_MP_COM = slice(4, 7)
+_MP_MOMENTS = slice(7, 10)
+_MP_PRODUCTS = slice(10, 13)
+_MP_PRINCIPAL = slice(13, 16)
+_MP_AXES = slice(16, 25)  # principal axes as rows of a 3x3 matrix
+_MP_SIZE = 25
+# Rows MassProperties.validate requires to be positive, in reporting order
+_MP_CHECKED = [_MP_VOLUME, _MP_AREA, _MP_MASS, _MP_DENSITY]
+_MP_CHECKED_NAMES = ('Volume', 'Surface area', 'Mass', 'Density')
+
+@functools.lru_cache(maxsize=None)
+def _mass_report_layout():
+    """
+    Buffer rows, unit scales and decimal places of the rounded numbers in
+    MassProperties.to_dict, in response order: volume mm³/m³, area mm²/m², mass
+    kg/g, COM, moments, products, principal moments and axes.
+    """
+    import numpy as np
+    
+    rows = [_MP_VOLUME, _MP_VOLUME, _MP_AREA, _MP_AREA, _MP_MASS, _MP_MASS, *range(4, _MP_SIZE)]
+    scales = np.array([1, 1e-9, 1, 1e-6, 1, 1e3] + [1] * 21)
+    decimals = np.array([2, 8, 2, 6, 4, 2] + [2] * 12 + [6] * 9)
+    return np.array(rows), scales, 10.0 ** decimals
 
 class MassProperties:
     """
     Calculate and store mass properties of CAD models.
     MANDATORY: Results must be physically consistent and reproducible.
+    
+    The numeric results live in one float64 buffer (see _MP_*) exposed through
+    properties, so to_dict can round them all in a single pass.
     """
+    __slots__ = ('_buf', 'material_name', 'is_validated', 'validation_notes')
     
     def __init__(self, volume_mm3: float, surface_area_mm2: float, 
                  density_kg_m3: float = 7850, material_name: str = 'Structural Steel'):
@@ -77,65 +193,140 @@ class MassProperties:
             density_kg_m3: Material density in kg/m³ (default: 7850 for steel)
             material_name: Name of the material
         """
-        self.volume_mm3 = volume_mm3
-        self.surface_area_mm2 = surface_area_mm2
-        self.density_kg_m3 = density_kg_m3
+        import numpy as np
+        
+        self._buf = np.zeros(_MP_SIZE)
+        self._buf[_MP_VOLUME] = volume_mm3
+        self._buf[_MP_AREA] = surface_area_mm2
+        self._buf[_MP_DENSITY] = density_kg_m3
         self.material_name = material_name
         
         # Calculate mass: Volume in mm³ → m³, then multiply by density
         # 1 mm³ = 1e-9 m³, so mass = volume_mm3 * 1e-9 * density_kg_m3
-        self.volume_m3 = volume_mm3 * 1e-9
-        self.mass_kg = self.volume_m3 * density_kg_m3
+        self._buf[_MP_MASS] = volume_mm3 * 1e-9 * density_kg_m3
         
-        # These will be set by geometry analysis
-        self.center_of_mass = (0.0, 0.0, 0.0)  # (X, Y, Z) in mm
-        self.moments_of_inertia = {'Ixx': 0.0, 'Iyy': 0.0, 'Izz': 0.0}  # kg·mm²
-        self.principal_axes = {'X': (1, 0, 0), 'Y': (0, 1, 0), 'Z': (0, 0, 1)}
+        # Center of mass and inertia are set by geometry analysis; principal axes start as X, Y, Z
+        self._buf[_MP_AXES] = np.eye(3).ravel()
         self.is_validated = False
         self.validation_notes = []
     
+    @property
+    def volume_mm3(self) -> float:
+        return float(self._buf[_MP_VOLUME])
+    
+    @property
+    def volume_m3(self) -> float:
+        return float(self._buf[_MP_VOLUME]) * 1e-9
+    
+    @property
+    def surface_area_mm2(self) -> float:
+        return float(self._buf[_MP_AREA])
+    
+    @property
+    def density_kg_m3(self) -> float:
+        return float(self._buf[_MP_DENSITY])
+    
+    @property
+    def mass_kg(self) -> float:
+        return float(self._buf[_MP_MASS])
+    
+    @property
+    def center_of_mass(self) -> Tuple[float, float, float]:
+        """(X, Y, Z) in mm"""
+        return tuple(self._buf[_MP_COM].tolist())
+    
+    @property
+    def moments_of_inertia(self) -> Dict[str, float]:
+        """Ixx, Iyy, Izz about the center of mass in kg·mm²"""
+        return dict(zip(('Ixx', 'Iyy', 'Izz'), self._buf[_MP_MOMENTS].tolist()))
+    
+    @property
+    def products_of_inertia(self) -> Dict[str, float]:
+        """Ixy, Ixz, Iyz (∫xy dm etc.) about the center of mass in kg·mm²"""
+        return dict(zip(('Ixy', 'Ixz', 'Iyz'), self._buf[_MP_PRODUCTS].tolist()))
+    
+    @property
+    def principal_moments(self) -> Tuple[float, float, float]:
+        """Principal moments in kg·mm², ascending"""
+        return tuple(self._buf[_MP_PRINCIPAL].tolist())
+    
+    @property
+    def principal_axes(self) -> Dict[str, Tuple[float, float, float]]:
+        """
+        Unit principal axes keyed 'X', 'Y', 'Z' as before, in the order of
+        principal_moments; they are the coordinate axes until compute_principal_axes runs
+        """
+        return dict(zip(('X', 'Y', 'Z'), map(tuple, self._buf[_MP_AXES].reshape(3, 3).tolist())))
+    
     def set_center_of_mass(self, x: float, y: float, z: float):
         """Set center of mass coordinates in mm"""
-        self.center_of_mass = (float(x), float(y), float(z))
+        self._buf[_MP_COM] = (x, y, z)
     
-    def set_moments_of_inertia(self, ixx: float, iyy: float, izz: float):
-        """Set moments of inertia in kg·mm²"""
-        self.moments_of_inertia = {'Ixx': float(ixx), 'Iyy': float(iyy), 'Izz': float(izz)}
+    def set_moments_of_inertia(self, ixx: float, iyy: float, izz: float,
+                               ixy: float = 0.0, ixz: float = 0.0, iyz: float = 0.0):
+        """Set moments and products of inertia (∫xy dm etc.) in kg·mm²"""
+        self._buf[_MP_MOMENTS] = (ixx, iyy, izz)
+        self._buf[_MP_PRODUCTS] = (ixy, ixz, iyz)
+    
+    def compute_principal_axes(self):
+        """Principal moments (ascending) and their unit axes from the inertia tensor"""
+        import numpy as np
+        
+        (ixx, iyy, izz), (ixy, ixz, iyz) = self._buf[_MP_MOMENTS], self._buf[_MP_PRODUCTS]
+        tensor = np.array([[ixx, -ixy, -ixz],
+                           [-ixy, iyy, -iyz],
+                           [-ixz, -iyz, izz]])
+        values, vectors = np.linalg.eigh(tensor)
+        self._buf[_MP_PRINCIPAL] = values
+        self._buf[_MP_AXES] = vectors.T.ravel()
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for API response"""
+        import numpy as np
+        
+        rows, scales, powers = _mass_report_layout()
+        (volume_mm3, volume_m3, area_mm2, area_m2, mass_kg, mass_g,
+         com_x, com_y, com_z, ixx, iyy, izz, ixy, ixz, iyz,
+         p1, p2, p3, *axes) = (np.round(self._buf[rows] * scales * powers) / powers).tolist()
         return {
             'material': {
                 'name': self.material_name,
                 'density_kg_m3': self.density_kg_m3
             },
             'volume': {
-                'mm3': round(self.volume_mm3, 2),
-                'm3': round(self.volume_m3, 8),
+                'mm3': volume_mm3,
+                'm3': volume_m3,
                 'unit': 'mm³'
             },
             'surface_area': {
-                'mm2': round(self.surface_area_mm2, 2),
-                'm2': round(self.surface_area_mm2 * 1e-6, 6),
+                'mm2': area_mm2,
+                'm2': area_m2,
                 'unit': 'mm²'
             },
             'mass': {
-                'kg': round(self.mass_kg, 4),
-                'g': round(self.mass_kg * 1000, 2),
+                'kg': mass_kg,
+                'g': mass_g,
                 'unit': 'kg'
             },
             'center_of_mass': {
-                'x_mm': round(self.center_of_mass[0], 2),
-                'y_mm': round(self.center_of_mass[1], 2),
-                'z_mm': round(self.center_of_mass[2], 2),
+                'x_mm': com_x,
+                'y_mm': com_y,
+                'z_mm': com_z,
                 'unit': 'mm'
             },
             'moments_of_inertia': {
-                'Ixx_kg_mm2': round(self.moments_of_inertia['Ixx'], 2),
-                'Iyy_kg_mm2': round(self.moments_of_inertia['Iyy'], 2),
-                'Izz_kg_mm2': round(self.moments_of_inertia['Izz'], 2),
+                'Ixx_kg_mm2': ixx,
+                'Iyy_kg_mm2': iyy,
+                'Izz_kg_mm2': izz,
+                'Ixy_kg_mm2': ixy,
+                'Ixz_kg_mm2': ixz,
+                'Iyz_kg_mm2': iyz,
                 'unit': 'kg·mm²'
             },
+            'principal_axes': {
+                'moments_kg_mm2': [p1, p2, p3],
+                'axes': {'X': axes[0:3], 'Y': axes[3:6], 'Z': axes[6:9]}
+            },
             'is_validated': self.is_validated,
             'validation_notes': self.validation_notes
         }
@@ -144,24 +335,10 @@ class MassProperties:
         """Validate that mass properties are physically consistent"""
         self.validation_notes = []
         
-        # Check volume
-        if self.volume_mm3 <= 0:
-            self.validation_notes.append("ERROR: Volume must be positive")
-            return False
-        
-        # Check surface area
-        if self.surface_area_mm2 <= 0:
-            self.validation_notes.append("ERROR: Surface area must be positive")
-            return False
-        
-        # Check mass
-        if self.mass_kg <= 0:
-            self.validation_notes.append("ERROR: Mass must be positive")
-            return False
-        
-        # Check density
-        if self.density_kg_m3 <= 0:
-            self.validation_notes.append("ERROR: Density must be positive")
+        # Volume, surface area, mass and density must all be positive; report the first that is not
+        non_positive = self._buf[_MP_CHECKED] <= 0
+        if non_positive.any():
+            self.validation_notes.append(f"ERROR: {_MP_CHECKED_NAMES[non_positive.argmax()]} must be positive")
             return False
         
         # Consistency check: mass should be proportional to volume and density
@@ -178,6 +355,20 @@ class MassProperties:
 
 class Centerline:
     """Centerline/Reference axis for CAD models"""
+    __slots__ = ('axis_type', 'origin', '_axes', '_axis_arrays', 'used_by_features')
+    
+    # Axis rows per axis type: (name, direction, half length, color, style)
+    _AXIS_TABLES = {
+        # Cylindrical centerline along Z-axis
+        'Z': (('Z', (0, 0, 1), 100, 'red', 'dashed'),),
+        # Orthogonal axes for prismatic parts
+        'XYZ': (
+            ('X', (1, 0, 0), 50, 'red', 'solid'),
+            ('Y', (0, 1, 0), 50, 'green', 'solid'),
+            ('Z', (0, 0, 1), 50, 'blue', 'solid')
+        )
+    }
+    
     def __init__(self, axis_type: str = 'Z', origin: Tuple[float, float, float] = (0, 0, 0)):
         """
         Initialize centerline
@@ -186,60 +377,55 @@ class Centerline:
         """
         self.axis_type = axis_type
         self.origin = origin
-        self.axes = self._create_axes()
-        self.used_by_features = []
+        self._axes: Optional[Dict[str, Dict[str, Any]]] = None  # built on first access
+        self._axis_arrays = None  # (starts, ends, colors, styles), built on first access
+        self.used_by_features: Dict[Any, Dict[str, str]] = {}  # feature key -> usage
         
+    @property
+    def axes(self) -> Dict[str, Dict[str, Any]]:
+        """Reference axes, created the first time they are asked for"""
+        if self._axes is None:
+            self._axes = self._create_axes()
+        return self._axes
+    
     def _create_axes(self) -> Dict[str, Dict[str, Any]]:
         """Create reference axes"""
         origin = self.origin
-        axes = {}
-        
-        if self.axis_type == 'Z':
-            # Cylindrical centerline along Z-axis
-            axes['Z'] = {
-                'start': (origin[0], origin[1], origin[2] - 100),
-                'end': (origin[0], origin[1], origin[2] + 100),
-                'direction': (0, 0, 1),
-                'color': 'red',
-                'style': 'dashed'
-            }
-        elif self.axis_type == 'XYZ':
-            # Orthogonal axes for prismatic parts
-            axes['X'] = {
-                'start': (origin[0] - 50, origin[1], origin[2]),
-                'end': (origin[0] + 50, origin[1], origin[2]),
-                'direction': (1, 0, 0),
-                'color': 'red',
-                'style': 'solid'
-            }
-            axes['Y'] = {
-                'start': (origin[0], origin[1] - 50, origin[2]),
-                'end': (origin[0], origin[1] + 50, origin[2]),
-                'direction': (0, 1, 0),
-                'color': 'green',
-                'style': 'solid'
-            }
-            axes['Z'] = {
-                'start': (origin[0], origin[1], origin[2] - 50),
-                'end': (origin[0], origin[1], origin[2] + 50),
-                'direction': (0, 0, 1),
-                'color': 'blue',
-                'style': 'solid'
+        return {
+            name: {
+                'start': tuple(o - d * half_length for o, d in zip(origin, direction)),
+                'end': tuple(o + d * half_length for o, d in zip(origin, direction)),
+                'direction': direction,
+                'color': color,
+                'style': style
             }
-        
-        return axes
+            for name, direction, half_length, color, style in self._AXIS_TABLES.get(self.axis_type, ())
+        }
     
     def get_axes_data(self) -> Dict[str, Dict[str, Any]]:
         """Return axes data for rendering"""
         return self.axes
     
-    def register_feature_usage(self, feature_name: str, feature_type: str):
-        """Track which features use this centerline"""
-        self.used_by_features.append({
+    def get_axes_arrays(self):
+        """Return axes as (starts[N,3], ends[N,3], colors, styles) for bulk rendering"""
+        if self._axis_arrays is None:
+            import numpy as np
+            axes = self.axes.values()
+            self._axis_arrays = (
+                np.array([axis['start'] for axis in axes], dtype=float).reshape(-1, 3),
+                np.array([axis['end'] for axis in axes], dtype=float).reshape(-1, 3),
+                [axis['color'] for axis in axes],
+                [axis['style'] for axis in axes]
+            )
+        return self._axis_arrays
+    
+    def register_feature_usage(self, feature_name: str, feature_type: str, key: Any = None):
+        """Track which features use this centerline (one entry per key, default the name)"""
+        self.used_by_features[feature_name if key is None else key] = {
             'feature': feature_name,
             'type': feature_type,
             'status': 'validated'
-        })
+        }
     
     def get_validation_report(self) -> Dict[str, Any]:
         """Generate centerline validation report"""
@@ -247,17 +433,164 @@ class Centerline:
             'centerline_created': True,
             'axis_type': self.axis_type,
             'origin': self.origin,
-            'axes_count': len(self.axes),
-            'features_using_centerline': self.used_by_features,
+            'axes_count': len(self._AXIS_TABLES.get(self.axis_type, ())),
+            'features_using_centerline': list(self.used_by_features.values()),
             'validation_status': 'PASS' if len(self.used_by_features) > 0 else 'WARNING'
         }
 
+@_njit
+def _involute_flank(base_radius, half_base, roll_start, roll_end, radii, angles):
+    """Fill radii/angles with evenly spaced involute samples between two roll angles"""
+    samples = len(radii)
+    step = (roll_end - roll_start) / (samples - 1) if samples > 1 else 0.0
+    for i in range(samples):
+        roll = roll_start + i * step
+        radii[i] = base_radius * math.sqrt(1.0 + roll * roll)
+        angles[i] = half_base - (roll - math.atan(roll))
+
+@_njit
+def _circular_points(radius, out):
+    """Fill out (count, 2) with count points evenly spaced on a circle"""
+    count = out.shape[0]
+    step = 2 * math.pi / count
+    for i in range(count):
+        out[i, 0] = radius * math.cos(i * step)
+        out[i, 1] = radius * math.sin(i * step)
+
+# cos() of the standard pressure angles (degrees); other angles fall back to math.cos
+_PA_COS = {angle: math.cos(math.radians(angle)) for angle in (14.5, 20.0, 25.0)}
+
+@functools.lru_cache(maxsize=256)
+def _involute_profile(teeth: int, module: float, pressure_angle: float,
+                      samples: int = 8) -> Tuple[Tuple[float, float], ...]:
+    """
+    Closed outline of a spur gear with involute flanks, as (x, y) points in mm.
+    Each tooth is two mirrored involutes from the base (or root) circle to the
+    outside circle, joined by radial lines down to the root circle where the
+    root lies inside the base circle.
+    """
+    import numpy as np
+    
+    pitch_radius = module * teeth / 2
+    outside_radius = pitch_radius + module
+    root_radius = pitch_radius - 1.25 * module
+    alpha = math.radians(pressure_angle)
+    base_radius = pitch_radius * (_PA_COS.get(pressure_angle) or math.cos(alpha))
+    
+    # Half tooth angle at the base circle: half the pitch-circle thickness plus inv(alpha)
+    half_base = math.pi / (2 * teeth) + math.tan(alpha) - alpha
+    
+    # Roll angles of the involute between its start radius and the outside circle
+    start_radius = max(base_radius, root_radius)
+    flank_radii = np.empty(samples)
+    flank_angles = np.empty(samples)
+    _involute_flank(base_radius, half_base,
+                    math.sqrt((start_radius / base_radius)**2 - 1),
+                    math.sqrt((outside_radius / base_radius)**2 - 1),
+                    flank_radii, flank_angles)
+    
+    # One tooth centred on angle 0: rising flank, then the mirrored falling flank
+    radii = np.concatenate((flank_radii, flank_radii[::-1]))
+    angles = np.concatenate((-flank_angles, flank_angles[::-1]))
+    if root_radius < base_radius:
+        radii = np.concatenate(([root_radius], radii, [root_radius]))
+        angles = np.concatenate(([-half_base], angles, [half_base]))
+    
+    # Rotate the tooth to every position at once: (teeth, 1) + (points,)
+    angles = (2 * math.pi / teeth) * np.arange(teeth)[:, None] + angles
+    points = np.column_stack(((radii * np.cos(angles)).ravel(),
+                              (radii * np.sin(angles)).ravel()))
+    return tuple(map(tuple, points.tolist()))
+
+@_njit(parallel=True)
+def _mesh_moment_sums(corners, out):
+    """
+    Fill out[0:11] with sums over the triangles of an (N, 3, 3) corner array:
+    6x signed volume, 2x area, the three det-weighted vertex sums and the six
+    det-weighted second-moment terms (xx, yy, zz, xy, xz, yz), in one fused pass.
+    """
+    det_sum = area2 = 0.0
+    sx = sy = sz = 0.0
+    mxx = myy = mzz = mxy = mxz = myz = 0.0
+    for t in _prange(corners.shape[0]):
+        ax, ay, az = corners[t, 0, 0], corners[t, 0, 1], corners[t, 0, 2]
+        bx, by, bz = corners[t, 1, 0], corners[t, 1, 1], corners[t, 1, 2]
+        cx, cy, cz = corners[t, 2, 0], corners[t, 2, 1], corners[t, 2, 2]
+        
+        # 6x signed volume of the tetrahedron (origin, a, b, c)
+        det = ax * (by * cz - bz * cy) + ay * (bz * cx - bx * cz) + az * (bx * cy - by * cx)
+        
+        ux, uy, uz = bx - ax, by - ay, bz - az
+        vx, vy, vz = cx - ax, cy - ay, cz - az
+        nx, ny, nz = uy * vz - uz * vy, uz * vx - ux * vz, ux * vy - uy * vx
+        area2 += math.sqrt(nx * nx + ny * ny + nz * nz)
+        
+        px, py, pz = ax + bx + cx, ay + by + cy, az + bz + cz
+        det_sum += det
+        sx += det * px
+        sy += det * py
+        sz += det * pz
+        mxx += det * (ax * ax + bx * bx + cx * cx + px * px)
+        myy += det * (ay * ay + by * by + cy * cy + py * py)
+        mzz += det * (az * az + bz * bz + cz * cz + pz * pz)
+        mxy += det * (ax * ay + bx * by + cx * cy + px * py)
+        mxz += det * (ax * az + bx * bz + cx * cz + px * pz)
+        myz += det * (ay * az + by * bz + cy * cz + py * pz)
+    
+    out[0], out[1] = det_sum, area2
+    out[2], out[3], out[4] = sx, sy, sz
+    out[5], out[6], out[7] = mxx, myy, mzz
+    out[8], out[9], out[10] = mxy, mxz, myz
+
+def _mesh_mass_integrals(corners) -> Tuple[float, float, Tuple[float, float, float], Any]:
+    """
+    Volume, surface area, centroid and unit-density inertia tensor (about the
+    centroid) of a closed triangle mesh given as an (N, 3, 3) array of corners.
+    Each triangle spans a signed tetrahedron with the origin whose closed-form
+    integrals are summed by _mesh_moment_sums.
+    """
+    import numpy as np
+    
+    sums = np.empty(11)
+    _mesh_moment_sums(np.ascontiguousarray(corners, dtype=np.float64), sums)
+    det_sum, area2, sx, sy, sz, mxx, myy, mzz, mxy, mxz, myz = sums
+    
+    volume = det_sum / 6
+    area = area2 / 2
+    centroid = np.array((sx, sy, sz)) / (24 * volume)
+    
+    # Second moments: integral of x_j*x_k over each tetrahedron with a vertex at the origin
+    second = np.array(((mxx, mxy, mxz), (mxy, myy, myz), (mxz, myz, mzz))) / 120
+    tensor = np.trace(second) * np.eye(3) - second
+    
+    # Parallel axis theorem: move the tensor from the origin to the centroid
+    tensor -= volume * (centroid @ centroid * np.eye(3) - np.outer(centroid, centroid))
+    return float(volume), float(area), tuple(centroid.tolist()), tensor
+
+def warm_up():
+    """
+    Compile (or load from Numba's disk cache) every kernel above on dummy data, so
+    the first real request does not pay for it. Safe to run on a background thread.
+    """
+    import numpy as np
+    
+    _involute_flank(1.0, 0.1, 0.0, 1.0, np.empty(2), np.empty(2))
+    _circular_points(1.0, np.empty((2, 2)))
+    _mesh_moment_sums(np.zeros((1, 3, 3)), np.empty(11))
+
 class Feature:
     """Base class for all CAD features"""
+    __slots__ = ('name', 'parameters', 'result')
+    
+    # Parameter name -> default; each is resolved once into a same-named slot attribute
+    _DEFAULTS: Dict[str, Any] = {}
+    
     def __init__(self, name: str, parameters: Dict[str, Any]):
         self.name = name
         self.parameters = parameters
         self.result = None
+        for key, default in self._DEFAULTS.items():
+            setattr(self, key, parameters.get(key, default))
         
     def build(self) -> cq.Workplane:
         """Build the feature - to be implemented by subclasses"""
@@ -265,91 +598,153 @@ class Feature:
 
 class SketchFeature(Feature):
     """2D sketch feature"""
+    _DEFAULTS = {'type': 'rectangle', 'width': 50, 'height': 30, 'radius': 25, 'sides': 6, 'points': ()}
+    __slots__ = tuple(_DEFAULTS)
+    
     def build(self) -> cq.Workplane:
-        workplane = cq.Workplane("XY")
+        workplane = _xy_workplane()
         
-        sketch_type = self.parameters.get('type', 'rectangle')
+        sketch_type = self.type
         if sketch_type == 'rectangle':
-            width = self.parameters.get('width', 50)
-            height = self.parameters.get('height', 30)
-            workplane = workplane.rect(width, height)
+            workplane = workplane.rect(self.width, self.height)
         elif sketch_type == 'circle':
-            radius = self.parameters.get('radius', 25)
-            workplane = workplane.circle(radius)
+            workplane = workplane.circle(self.radius)
         elif sketch_type == 'polygon':
-            sides = self.parameters.get('sides', 6)
-            radius = self.parameters.get('radius', 25)
-            workplane = workplane.polygon(sides, radius)
+            workplane = workplane.polygon(self.sides, self.radius)
+        elif sketch_type == 'polyline':
+            workplane = workplane.polyline(self.points).close()
             
         return workplane
 
 class ExtrudeFeature(Feature):
     """Extrusion feature"""
+    _DEFAULTS = {'depth': 10}
+    __slots__ = tuple(_DEFAULTS)
+    
     def build(self, profile: cq.Workplane) -> cq.Workplane:
-        depth = self.parameters.get('depth', 10)
-        return profile.extrude(depth)
+        return profile.extrude(self.depth)
 
 class RevolveFeature(Feature):
     """Revolution feature"""
+    _DEFAULTS = {'angle': 360}
+    __slots__ = tuple(_DEFAULTS)
+    
     def build(self, profile: cq.Workplane) -> cq.Workplane:
-        angle = self.parameters.get('angle', 360)
-        return profile.revolve(angle)
+        return profile.revolve(self.angle)
 
 class HoleFeature(Feature):
     """Hole cutting feature"""
+    _DEFAULTS = {'diameter': 10, 'depth': None, 'x': 0, 'y': 0}  # Through hole if depth is None
+    __slots__ = tuple(_DEFAULTS)
+    
     def build(self, workpiece: cq.Workplane) -> cq.Workplane:
-        diameter = self.parameters.get('diameter', 10)
-        depth = self.parameters.get('depth', None)  # Through hole if None
-        x = self.parameters.get('x', 0)
-        y = self.parameters.get('y', 0)
-        
-        hole = workpiece.faces(">Z").workplane().center(x, y).hole(diameter, depth)
+        hole = workpiece.faces(">Z").workplane().center(self.x, self.y).hole(self.diameter, self.depth)
         return hole
+    
+    def size_key(self) -> Tuple[float, Optional[float]]:
+        """(diameter, depth) - holes sharing it can be cut together"""
+        return (self.diameter, self.depth)
+    
+    @staticmethod
+    def build_group(holes: List[HoleFeature], workpiece: cq.Workplane) -> cq.Workplane:
+        """Cut same-sized holes at all their positions with a single boolean operation"""
+        diameter, depth = holes[0].size_key()
+        points = [(hole.x, hole.y) for hole in holes]
+        return workpiece.faces(">Z").workplane().pushPoints(points).hole(diameter, depth)
 
 class FilletFeature(Feature):
     """Edge filleting feature"""
+    _DEFAULTS = {'radius': 2, 'selector': '|Z'}
+    __slots__ = tuple(_DEFAULTS)
+    
     def build(self, workpiece: cq.Workplane) -> cq.Workplane:
-        radius = self.parameters.get('radius', 2)
-        selector = self.parameters.get('selector', '|Z')
-        return workpiece.edges(selector).fillet(radius)
+        return workpiece.edges(self.selector).fillet(self.radius)
 
 class ChamferFeature(Feature):
     """Edge chamfering feature"""
+    _DEFAULTS = {'length': 2, 'selector': '|Z'}
+    __slots__ = tuple(_DEFAULTS)
+    
     def build(self, workpiece: cq.Workplane) -> cq.Workplane:
-        length = self.parameters.get('length', 2)
-        selector = self.parameters.get('selector', '|Z')
-        return workpiece.edges(selector).chamfer(length)
+        return workpiece.edges(self.selector).chamfer(self.length)
 
 class PatternFeature(Feature):
     """Pattern feature (linear/circular)"""
+    # count defaults to 3 for linear and 6 for circular patterns
+    _DEFAULTS = {'type': 'linear', 'count': None, 'spacing': 20, 'direction': 'X', 'radius': 30}
+    __slots__ = tuple(_DEFAULTS)
+    
     def build(self, workpiece: cq.Workplane) -> cq.Workplane:
-        pattern_type = self.parameters.get('type', 'linear')
+        import numpy as np
+        
+        pattern_type = self.type
         
         if pattern_type == 'linear':
-            count = self.parameters.get('count', 3)
-            spacing = self.parameters.get('spacing', 20)
-            direction = self.parameters.get('direction', 'X')
-            return workpiece.pushPoints([(i * spacing, 0) if direction == 'X' else (0, i * spacing) 
-                                       for i in range(count)])
+            count = 3 if self.count is None else self.count
+            offsets = np.arange(count) * self.spacing
+            zeros = np.zeros(count)
+            xs, ys = (offsets, zeros) if self.direction == 'X' else (zeros, offsets)
+            points = np.column_stack((xs, ys))
         elif pattern_type == 'circular':
-            count = self.parameters.get('count', 6)
-            radius = self.parameters.get('radius', 30)
-            return workpiece.pushPoints([(radius * math.cos(2 * math.pi * i / count),
-                                        radius * math.sin(2 * math.pi * i / count))
-                                       for i in range(count)])
-        return workpiece
+            count = 6 if self.count is None else self.count
+            points = np.empty((count, 2))
+            if count:
+                _circular_points(float(self.radius), points)
+        else:
+            return workpiece
+        
+        # Hand pushPoints ready-made Vectors so it does not parse each point again
+        Vector = _cq().Vector
+        return workpiece.pushPoints([Vector(x, y, 0.0) for x, y in points.tolist()])
+
+def _hole_size(feature: Feature) -> Optional[Tuple[float, Optional[float]]]:
+    """Grouping key for CADModel.build: a hole's size, None for any other feature"""
+    return feature.size_key() if type(feature) is HoleFeature else None
+
+# Density CADModel.get_mass assumes when none is given (structural steel)
+_DEFAULT_DENSITY_G_CM3 = 7.85
+
+def _mass_g(volume_mm3: float, density: float = _DEFAULT_DENSITY_G_CM3) -> float:
+    """Mass in grams of volume_mm3 at density g/cm³"""
+    return volume_mm3 / 1000 * density  # mm³ -> cm³
 
 class CADModel:
     """Main CAD model class that manages features and builds geometry"""
+    # Feature class -> build step; sketches start a new profile, the rest consume the current one.
+    # Holes are not listed: build() cuts runs of them together.
+    _DISPATCH = {
+        SketchFeature: lambda feature, current: feature.build(),
+        ExtrudeFeature: lambda feature, current: feature.build(current),
+        RevolveFeature: lambda feature, current: feature.build(current),
+        FilletFeature: lambda feature, current: feature.build(current),
+        ChamferFeature: lambda feature, current: feature.build(current),
+        PatternFeature: lambda feature, current: feature.build(current)
+    }
+    __slots__ = ('features', '_handlers', '_hole_sizes', '_last_sketch', 'result', 'model_type',
+                 'centerline', 'material_name', 'mass_properties', 'simulation_executed',
+                 '_cached_bbox', '_cached_integrals', '_cached_mesh_props', '_meshed',
+                 '_mass_props_key', '_mass_stages',
+                 'gear_specs')
+    
     def __init__(self, model_type: str = 'prismatic', material_name: str = 'Structural Steel'):
         self.features: List[Feature] = []
-        self.workplane = cq.Workplane("XY")
+        # Build steps resolved in add_feature, kept parallel to self.features
+        self._handlers: List[Optional[Callable[[Feature, cq.Workplane], cq.Workplane]]] = []
+        self._hole_sizes: List[Optional[Tuple[float, Optional[float]]]] = []
+        self._last_sketch = 0
         self.result = None
         self.model_type = model_type  # 'cylindrical', 'symmetric', or 'prismatic'
         self.centerline = None
         self.material_name = material_name
         self.mass_properties: Optional[MassProperties] = None
         self.simulation_executed = False  # MANDATORY: Track if simulations can proceed
+        self._cached_bbox: Optional[Tuple[float, float, float]] = None
+        self._cached_integrals: Dict[Optional[float], Tuple[Any, ...]] = {}  # tolerance -> _mass_integrals()
+        self._cached_mesh_props = None
+        self._meshed: Optional[Tuple[float, float]] = None  # tolerances of the triangulation on self.result
+        self._mass_props_key = None  # (material name, density) of self.mass_properties
+        self._mass_stages = set()  # compute_* stages already applied to self.mass_properties
+        self.gear_specs: Optional[Dict[str, Any]] = None  # filled in by ParametricEngine.create_gear
         self._initialize_centerline()
         
     def _initialize_centerline(self):
@@ -358,35 +753,73 @@ class CADModel:
             self.centerline = Centerline(axis_type='Z', origin=(0, 0, 0))
         else:
             self.centerline = Centerline(axis_type='XYZ', origin=(0, 0, 0))
-        
+
+    def __copy__(self) -> CADModel:
+        """
+        Copy that shares only the built geometry; feature lists, caches, mass
+        properties and the centerline are the copy's own, so adding features to or
+        analysing one model leaves the other untouched.
+        """
+        clone = CADModel.__new__(CADModel)
+        for slot in self.__slots__:
+            setattr(clone, slot, getattr(self, slot))
+        clone.features = list(self.features)
+        clone._handlers = list(self._handlers)
+        clone._hole_sizes = list(self._hole_sizes)
+        clone._cached_integrals = dict(self._cached_integrals)
+        clone._mass_stages = set(self._mass_stages)
+        if self.gear_specs is not None:
+            clone.gear_specs = dict(self.gear_specs)
+        if self.mass_properties is not None:
+            clone.mass_properties = copy.copy(self.mass_properties)
+            clone.mass_properties._buf = self.mass_properties._buf.copy()
+            clone.mass_properties.validation_notes = list(self.mass_properties.validation_notes)
+        if self.centerline is not None:
+            clone.centerline = copy.copy(self.centerline)
+            clone.centerline.used_by_features = dict(self.centerline.used_by_features)
+        return clone
+
     def add_feature(self, feature: Feature):
         """Add a feature to the model"""
         self.features.append(feature)
+        self._handlers.append(self._DISPATCH.get(type(feature)))
+        self._hole_sizes.append(_hole_size(feature))
+        if type(feature) is SketchFeature:
+            self._last_sketch = len(self.features) - 1
         # Track centerline usage for symmetric/centered features
         if isinstance(feature, (HoleFeature, PatternFeature, RevolveFeature)):
-            self.centerline.register_feature_usage(feature.name, type(feature).__name__)
+            # Keyed by identity: holes that share a default name are still distinct features
+            self.centerline.register_feature_usage(feature.name, type(feature).__name__, id(feature))
         
     def build(self) -> cq.Solid:
         """Build the complete model by executing all features"""
-        current = cq.Workplane("XY")
-        
-        for feature in self.features:
-            if isinstance(feature, SketchFeature):
-                current = feature.build()
-            elif isinstance(feature, ExtrudeFeature):
-                current = feature.build(current)
-            elif isinstance(feature, RevolveFeature):
-                current = feature.build(current)
-            elif isinstance(feature, HoleFeature):
-                current = feature.build(current)
-            elif isinstance(feature, FilletFeature):
-                current = feature.build(current)
-            elif isinstance(feature, ChamferFeature):
-                current = feature.build(current)
-            elif isinstance(feature, PatternFeature):
-                current = feature.build(current)
+        _enable_parallel_booleans()
+        
+        # A sketch starts a fresh profile and discards everything built before it,
+        # so only the chain from the last sketch onwards can reach the result
+        start = self._last_sketch
+        # ...and it brings its own workplane; only a chain without one needs a blank
+        starts_with_sketch = start < len(self.features) and type(self.features[start]) is SketchFeature
+        current = None if starts_with_sketch else _xy_workplane()
+        steps = zip(self.features[start:], self._handlers[start:], self._hole_sizes[start:])
+        
+        for size, group in itertools.groupby(steps, key=operator.itemgetter(2)):
+            if size is not None:
+                current = HoleFeature.build_group([feature for feature, _, _ in group], current)
+                continue
+            for feature, handler, _ in group:
+                if handler:
+                    current = handler(feature, current)
                 
         self.result = current
+        # Geometry changed; drop the cached OCCT queries
+        self._cached_bbox = None
+        self._cached_integrals = {}
+        self._cached_mesh_props = None
+        self._meshed = None
+        self.mass_properties = None
+        self._mass_props_key = None
+        self._mass_stages = set()
         return current.vals()[0] if current.vals() else None
     
     def compute_mass_properties(self, material_name: Optional[str] = None, 
@@ -394,6 +827,39 @@ class CADModel:
         """
         MANDATORY: Compute mass properties using exact CAD geometry.
         STEP 1 of simulation: Must succeed before any other simulation.
+        Runs compute_mass, compute_com and compute_inertia, then validates.
+        
+        Args:
+            material_name: Override material name
+            density_override: Override density in kg/m³
+        """
+        mass_properties = self.compute_mass(material_name, density_override)
+        
+        # Same geometry and material as last time: the validated result still holds
+        if mass_properties.is_validated:
+            return mass_properties
+        
+        # Try to calculate center of mass and moments of inertia
+        try:
+            self.compute_com()
+            self.compute_inertia()
+        except Exception as e:
+            mass_properties.validation_notes.append(f"Warning: Could not calculate COM/MOI: {str(e)}")
+        
+        # Validate mass properties
+        if not mass_properties.validate():
+            raise ValueError(f"Mass properties validation failed: {mass_properties.validation_notes}")
+        
+        # MANDATORY: Mark simulation as ready to proceed to Step 2
+        self.simulation_executed = True
+        
+        return mass_properties
+    
+    def compute_mass(self, material_name: Optional[str] = None,
+                     density_override: Optional[float] = None) -> MassProperties:
+        """
+        Volume, surface area and mass stage of compute_mass_properties.
+        Center of mass and inertia are left to compute_com/compute_inertia.
         
         Args:
             material_name: Override material name
@@ -402,12 +868,8 @@ class CADModel:
         if not self.result:
             raise ValueError("Cannot compute mass properties without built geometry")
         
-        # Get volume and surface area from exact CAD geometry
-        volume_mm3 = self.get_volume()
-        surface_area_mm2 = self._get_surface_area()
-        
         # Determine material and density
-        mat_db = MaterialDatabase()
+        mat_db = _MATERIAL_DB
         if material_name:
             mat_name, density, _ = mat_db.get_density(material_name)
         else:
@@ -417,74 +879,119 @@ class CADModel:
         if density_override is not None:
             density = density_override
         
+        # Keyed on the material actually used, so a changed self.material_name is seen
+        key = (mat_name, density)
+        if self.mass_properties is not None and self._mass_props_key == key:
+            return self.mass_properties
+        
+        # Get volume and surface area from exact CAD geometry
+        volume_mm3 = self.get_volume()
+        surface_area_mm2 = self._get_surface_area()
+        
         # Create mass properties object
         self.mass_properties = MassProperties(volume_mm3, surface_area_mm2, density, mat_name)
+        self._mass_props_key = key
+        self._mass_stages = set()
         
-        # Try to calculate center of mass and moments of inertia
-        try:
+        return self.mass_properties
+    
+    def compute_com(self) -> Tuple[float, float, float]:
+        """Center of mass stage; computes the mass first if needed"""
+        mass_properties = self.mass_properties or self.compute_mass()
+        if 'com' not in self._mass_stages:
             com = self._calculate_center_of_mass()
             if com:
-                self.mass_properties.set_center_of_mass(*com)
-            
+                mass_properties.set_center_of_mass(*com)
+            self._mass_stages.add('com')
+        return mass_properties.center_of_mass
+    
+    def compute_inertia(self) -> Dict[str, float]:
+        """Moments of inertia stage; computes the mass first if needed"""
+        mass_properties = self.mass_properties or self.compute_mass()
+        if 'inertia' not in self._mass_stages:
             moi = self._calculate_moments_of_inertia()
             if moi:
-                self.mass_properties.set_moments_of_inertia(*moi)
-        except Exception as e:
-            self.mass_properties.validation_notes.append(f"Warning: Could not calculate COM/MOI: {str(e)}")
-        
-        # Validate mass properties
-        if not self.mass_properties.validate():
-            raise ValueError(f"Mass properties validation failed: {self.mass_properties.validation_notes}")
-        
-        # MANDATORY: Mark simulation as ready to proceed to Step 2
-        self.simulation_executed = True
-        
-        return self.mass_properties
+                mass_properties.set_moments_of_inertia(*moi)
+                mass_properties.compute_principal_axes()
+            self._mass_stages.add('inertia')
+        return mass_properties.moments_of_inertia
+    
+    def _mesh_properties(self):
+        """Mesh integrals of the built solid (see _mesh_mass_integrals), tessellated once per build"""
+        if self._cached_mesh_props is None:
+            import numpy as np
+            
+            vertices, triangles = self.result.val().tessellate(0.1)
+            points = np.array([vertex.toTuple() for vertex in vertices])
+            self._cached_mesh_props = _mesh_mass_integrals(points[np.array(triangles)])
+        return self._cached_mesh_props
+    
+    def _mass_integrals(self, tolerance: Optional[float] = None):
+        """
+        Volume, surface area, centroid and unit-density inertia tensor (3x3 nested
+        tuples, mm⁵, about the centroid), read off a single pair of OCCT BRepGProp
+        integrations and cached until the next build. tolerance switches OCCT to
+        adaptive integration with that relative error (e.g. 1e-3 interactive, 1e-6
+        for final results). Falls back to the tessellated-mesh integrals for shapes
+        OCCT cannot integrate.
+        """
+        cached = self._cached_integrals.get(tolerance)
+        if cached is not None:
+            return cached
+        try:
+            from OCP.BRepGProp import BRepGProp
+            from OCP.GProp import GProp_GProps
+            
+            shape = self.result.val().wrapped
+            volume_props, surface_props = GProp_GProps(), GProp_GProps()
+            if tolerance is None:
+                BRepGProp.VolumeProperties_s(shape, volume_props)
+                BRepGProp.SurfaceProperties_s(shape, surface_props)
+            else:
+                BRepGProp.VolumeProperties_s(shape, volume_props, tolerance)
+                BRepGProp.SurfaceProperties_s(shape, surface_props, tolerance)
+            
+            centre = volume_props.CentreOfMass()
+            matrix = volume_props.MatrixOfInertia()
+            tensor = tuple(tuple(matrix.Value(i, j) for j in (1, 2, 3)) for i in (1, 2, 3))
+            integrals = (volume_props.Mass(), surface_props.Mass(),
+                         (centre.X(), centre.Y(), centre.Z()), tensor)
+        except Exception:
+            volume, area, centroid, tensor = self._mesh_properties()
+            integrals = (volume, area, centroid, tuple(map(tuple, tensor.tolist())))
+        self._cached_integrals[tolerance] = integrals
+        return integrals
     
     def _get_surface_area(self) -> float:
-        """Calculate surface area in mm² using triangulated mesh"""
+        """Calculate surface area in mm²"""
         try:
             if self.result:
-                # Get mesh representation
-                mesh = self.result.toSvg()  # This may not work, try alternative
-                # Fallback: approximate using bounding box
-                bbox = self.result.BoundingBox()
-                l, w, h = bbox.xlen, bbox.ylen, bbox.zlen
-                return 2 * (l*w + l*h + w*h)
+                return self._mass_integrals()[1]
         except:
-            # Fallback approximation
-            bbox = self.result.BoundingBox() if self.result else None
-            if bbox:
-                l, w, h = bbox.xlen, bbox.ylen, bbox.zlen
-                return 2 * (l*w + l*h + w*h)
+            pass
         return 0.0
     
     def _calculate_center_of_mass(self) -> Optional[Tuple[float, float, float]]:
         """Calculate center of mass (X, Y, Z) in mm"""
         try:
             if self.result:
-                # Use CadQuery's center of mass calculation
-                center = self.result.Center()
-                return (center.x, center.y, center.z)
+                return self._mass_integrals()[2]
         except:
             pass
         return None
     
-    def _calculate_moments_of_inertia(self) -> Optional[Tuple[float, float, float]]:
-        """Calculate moments of inertia (Ixx, Iyy, Izz) in kg·mm²"""
+    def _calculate_moments_of_inertia(self) -> Optional[Tuple[float, ...]]:
+        """
+        Calculate moments (Ixx, Iyy, Izz) and products (Ixy, Ixz, Iyz) of inertia
+        about the center of mass in kg·mm²
+        """
         try:
             if self.result and self.mass_properties:
-                # Approximate using parallel axis theorem
-                bbox = self.result.BoundingBox()
-                l, w, h = bbox.xlen, bbox.ylen, bbox.zlen
-                m = self.mass_properties.mass_kg
-                
-                # Solid box moments of inertia (approximate)
-                Ixx = (m / 12.0) * (w**2 + h**2)
-                Iyy = (m / 12.0) * (l**2 + h**2)
-                Izz = (m / 12.0) * (l**2 + w**2)
-                
-                return (Ixx, Iyy, Izz)
+                # Unit-density tensor (mm⁵) times density in kg/mm³; its off-diagonals hold -∫xy etc.
+                tensor = self._mass_integrals()[3]
+                density = self.mass_properties.density_kg_m3 * 1e-9
+                return (tensor[0][0] * density, tensor[1][1] * density, tensor[2][2] * density,
+                        -tensor[0][1] * density, -tensor[0][2] * density, -tensor[1][2] * density)
         except:
             pass
         return None
@@ -497,28 +1004,74 @@ class CADModel:
         """Get centerline validation report"""
         return self.centerline.get_validation_report()
     
+    def ensure_meshed(self, linear_tol: float = 0.1, angular_tol: float = 0.5):
+        """
+        Triangulate the built solid in place (faces meshed in parallel), once per
+        build and tolerance pair, so mesh-based exporters can reuse it.
+        """
+        if self.result and self._meshed != (linear_tol, angular_tol):
+            from OCP.BRepMesh import BRepMesh_IncrementalMesh
+            
+            BRepMesh_IncrementalMesh(self.result.val().wrapped, linear_tol, False, angular_tol, True)
+            self._meshed = (linear_tol, angular_tol)
+    
     def get_bounding_box(self) -> Tuple[float, float, float]:
         """Get model bounding box dimensions"""
-        if self.result:
-            bbox = self.result.BoundingBox()
-            return (bbox.xlen, bbox.ylen, bbox.zlen)
-        return (0, 0, 0)
+        if self._cached_bbox is None:
+            if not self.result:
+                return (0, 0, 0)
+            bbox = self.result.val().BoundingBox()
+            self._cached_bbox = (bbox.xlen, bbox.ylen, bbox.zlen)
+        return self._cached_bbox
     
     def get_volume(self) -> float:
         """Get model volume in mm³"""
-        if self.result:
-            return self.result.Volume()
-        return 0
+        if not self.result:
+            return 0
+        return self._mass_integrals()[0]
     
-    def get_mass(self, density: float = 7.85) -> float:
+    def get_mass(self, density: float = _DEFAULT_DENSITY_G_CM3) -> float:
         """Get model mass in grams (density in g/cm³)"""
-        volume_cm3 = self.get_volume() / 1000  # Convert mm³ to cm³
-        return volume_cm3 * density
+        return _mass_g(self.get_volume(), density)
+    
+    def get_metrics(self) -> Tuple[Tuple[float, float, float], float, float, float, int]:
+        """
+        (bounding box, volume mm³, mass g as get_mass gives it, surface area mm²,
+        feature count) in one go; volume and area come from the same cached OCCT integration.
+        """
+        if not self.result:
+            return (0, 0, 0), 0, 0, 0, len(self.features)
+        volume, area = self._mass_integrals()[:2]
+        return self.get_bounding_box(), volume, _mass_g(volume), area, len(self.features)
+
+def _freeze(value: Any) -> Any:
+    """Hashable form of a create_* argument (lists become tuples)"""
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+def _memoize_model(create):
+    """
+    Cache built models per argument set so repeat parameters skip the BRep build.
+    Each call gets its own copy (see CADModel.__copy__), so features and analysis
+    state are not shared; the built geometry itself must not be mutated.
+    """
+    cached = functools.lru_cache(maxsize=128)(create)
+    
+    @functools.wraps(create)
+    def wrapper(*args, **kwargs):
+        args = tuple(_freeze(arg) for arg in args)
+        kwargs = {key: _freeze(value) for key, value in kwargs.items()}
+        return copy.copy(cached(*args, **kwargs))
+    
+    wrapper.cache_clear = cached.cache_clear
+    return wrapper
 
 class ParametricEngine:
     """Main parametric CAD engine"""
     
     @staticmethod
+    @_memoize_model
     def create_gear(teeth: int, module: float, thickness: float, bore_diameter: float = 0, 
                    pressure_angle: float = 20.0) -> CADModel:
         """
@@ -539,7 +1092,7 @@ class ParametricEngine:
         pitch_diameter = module * teeth
         outside_diameter = pitch_diameter + 2 * module
         root_diameter = pitch_diameter - 2.5 * module
-        base_diameter = pitch_diameter * math.cos(math.radians(pressure_angle))
+        base_diameter = pitch_diameter * (_PA_COS.get(pressure_angle) or math.cos(math.radians(pressure_angle)))
         
         # Validate gear specification
         if teeth < 10:
@@ -547,8 +1100,8 @@ class ParametricEngine:
         
         # Create gear blank (as proper involute profile, not cylinder)
         blank = SketchFeature("gear_blank", {
-            "type": "circle", 
-            "radius": outside_diameter/2,
+            "type": "polyline",
+            "points": _involute_profile(teeth, module, pressure_angle),
             "description": f"Involute gear OD {outside_diameter}mm (Module {module}, {teeth} teeth, {pressure_angle}° PA)"
         })
         extrude = ExtrudeFeature("extrude", {"depth": thickness})
@@ -584,6 +1137,7 @@ class ParametricEngine:
         return model
     
     @staticmethod
+    @_memoize_model
     def create_shaft(diameter: float, length: float) -> CADModel:
         """Create a cylindrical shaft with centerline"""
         model = CADModel(model_type='cylindrical')
@@ -599,6 +1153,7 @@ class ParametricEngine:
         return model
     
     @staticmethod
+    @_memoize_model
     def create_bracket(width: float, height: float, thickness: float, 
                       mounting_holes: List[Tuple[float, float, float]] = None) -> CADModel:
         """Create a mounting bracket with optional mounting holes and reference axes"""
@@ -657,11 +1212,16 @@ class ParametricEngine:
         return model
 
 def export_stl(model: CADModel, filename: str) -> bool:
-    """Export model to STL format"""
+    """Export model to binary STL, meshed with a tolerance scaled to the model size"""
     try:
         if model.result:
-            cq.exporters.export(model.result, filename)
-            return True
+            from OCP.StlAPI import StlAPI_Writer
+            
+            # 0.1 mm is CadQuery's default; only coarsen it for parts larger than 100 mm
+            model.ensure_meshed(max(0.1, max(model.get_bounding_box()) * 1e-3), 0.1)
+            writer = StlAPI_Writer()
+            writer.ASCIIMode = False
+            return writer.Write(model.result.val().wrapped, filename)
         return False
     except Exception as e:
         print(f"STL export failed: {e}")
@@ -671,7 +1231,7 @@ def export_step(model: CADModel, filename: str) -> bool:
     """Export model to STEP format"""
     try:
         if model.result:
-            cq.exporters.export(model.result, filename)
+            _cq().exporters.export(model.result, filename, exportType='STEP')
             return True
         return False
     except Exception as e:
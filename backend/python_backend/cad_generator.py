@@ -1,25 +1,44 @@
 from OCC.Core.BRepPrimAPI import (BRepPrimAPI_MakeCylinder, BRepPrimAPI_MakeBox, 
-                                   BRepPrimAPI_MakeTorus, BRepPrimAPI_MakeSphere)
-from OCC.Core.BRepAlgoAPI import BRepAlgoAPI_Cut, BRepAlgoAPI_Fuse
-from OCC.Core.gp import gp_Pnt, gp_Ax2, gp_Dir, gp_Vec
-from OCC.Core.BRepBuilderAPI import BRepBuilderAPI_Transform, BRepBuilderAPI_MakeEdge
+                                   BRepPrimAPI_MakeTorus, BRepPrimAPI_MakeSphere,
+                                   BRepPrimAPI_MakePrism, BRepPrimAPI_MakeRevol)
+from OCC.Core.BRepAlgoAPI import BRepAlgoAPI_Cut
+from OCC.Core.gp import gp_Pnt, gp_Ax1, gp_Ax2, gp_Dir, gp_Vec
+from OCC.Core.BRepBuilderAPI import (BRepBuilderAPI_Transform, BRepBuilderAPI_MakeEdge,
+                                     BRepBuilderAPI_MakePolygon, BRepBuilderAPI_MakeFace)
 from OCC.Core.STEPControl import STEPControl_Writer, STEPControl_AsIs
 from OCC.Core.IFSelect import IFSelect_RetDone
 from OCC.Core.TopoDS import TopoDS_Shape
+import asyncio
+import functools
 import math
 import json
 import sys
+from concurrent.futures import ThreadPoolExecutor
+
+from cad_engine import _involute_profile
 
 def generate_gear(params):
-    """Generate a gear using OpenCascade"""
+    """Generate an involute spur gear using OpenCascade"""
     radius = params.get('radius', 25)
     thickness = params.get('thickness', 10)
-    teeth = params.get('teeth', 20)
-    
-    # Create base cylinder
-    base = BRepPrimAPI_MakeCylinder(radius, thickness).Shape()
-    
-    # Create center hole (20% of radius)
+    teeth = int(params.get('teeth', 20))
+    # radius is the outside radius, r = m * (z + 2) / 2; a given module overrides it
+    if 'module' in params:
+        module = params['module']
+        radius = module * (teeth + 2) / 2
+    else:
+        module = 2 * radius / (teeth + 2)
+    pressure_angle = params.get('pressureAngle', 20.0)
+    
+    # Tooth outline (Numba-compiled involute sampling in cad_engine), extruded
+    outline = BRepBuilderAPI_MakePolygon()
+    for x, y in _involute_profile(teeth, float(module), float(pressure_angle)):
+        outline.Add(gp_Pnt(x, y, 0))
+    outline.Close()
+    face = BRepBuilderAPI_MakeFace(outline.Wire()).Face()
+    base = BRepPrimAPI_MakePrism(face, gp_Vec(0, 0, thickness)).Shape()
+    
+    # Create center hole (20% of the outside radius, inside the root circle)
     hole_radius = radius * 0.2
     hole = BRepPrimAPI_MakeCylinder(hole_radius, thickness).Shape()
     
@@ -63,35 +82,51 @@ def generate_bolt(params):
     head_radius = params.get('headRadius', 6)
     head_height = params.get('headHeight', 3)
     
-    # Create shaft
-    shaft = BRepPrimAPI_MakeCylinder(radius, length).Shape()
+    # Half cross-section in the XZ plane: the union of the head and shaft rectangles,
+    # both standing on z = 0, as (radius, height) corners after the origin
+    wide, tall = sorted(((head_radius, head_height), (radius, length)), reverse=True)
+    if wide[1] >= tall[1]:
+        # One cylinder contains the other
+        corners = [(wide[0], 0), wide, (0, wide[1])]
+    else:
+        corners = [(wide[0], 0), wide, (tall[0], wide[1]), tall, (0, tall[1])]
     
-    # Create head
-    head = BRepPrimAPI_MakeCylinder(head_radius, head_height).Shape()
+    profile = BRepBuilderAPI_MakePolygon()
+    for r, z in [(0, 0)] + corners:
+        profile.Add(gp_Pnt(r, 0, z))
+    profile.Close()
     
-    # Fuse head and shaft
-    bolt = BRepAlgoAPI_Fuse(head, shaft).Shape()
+    # Revolving the profile gives the fused solid without a boolean operation
+    face = BRepBuilderAPI_MakeFace(profile.Wire()).Face()
+    bolt = BRepPrimAPI_MakeRevol(face, gp_Ax1(gp_Pnt(0, 0, 0), gp_Dir(0, 0, 1))).Shape()
     
     return bolt
 
+# Generator per component type; unknown types fall back to a bracket
+_GENERATORS = {
+    'gear': generate_gear,
+    'shaft': generate_shaft,
+    'bearing': generate_bearing,
+    'bracket': generate_bracket,
+    'plate': generate_bracket,
+    'bolt': generate_bolt
+}
+
+@functools.lru_cache(maxsize=128)
+def _generate_cached(component_type, frozen_params):
+    """Build a shape once per (type, parameters); callers only read the shape"""
+    return _GENERATORS.get(component_type, generate_bracket)(dict(frozen_params))
+
 def generate_component(design_data):
     """Main function to generate component based on type"""
     component_type = design_data.get('type', 'bracket').lower()
     params = design_data.get('parameters', {})
     
-    generators = {
-        'gear': generate_gear,
-        'shaft': generate_shaft,
-        'bearing': generate_bearing,
-        'bracket': generate_bracket,
-        'plate': generate_bracket,
-        'bolt': generate_bolt
-    }
-    
-    generator = generators.get(component_type, generate_bracket)
-    shape = generator(params)
-    
-    return shape
+    try:
+        return _generate_cached(component_type, tuple(sorted(params.items())))
+    except TypeError:
+        # Unhashable parameter values (lists, dicts) can't be cached
+        return _GENERATORS.get(component_type, generate_bracket)(params)
 
 def export_to_step(shape, filename):
     """Export shape to STEP file"""
@@ -101,6 +136,23 @@ def export_to_step(shape, filename):
     
     return status == IFSelect_RetDone
 
+# STEP writes run here, off the caller's thread. One worker: the STEP translator's
+# settings are process-wide statics, so concurrent writers are not safe
+_STEP_POOL = ThreadPoolExecutor(max_workers=1, thread_name_prefix='step-export')
+
+async def export_to_step_async(shape, filename):
+    """Export shape to STEP file without blocking the event loop"""
+    return await asyncio.get_running_loop().run_in_executor(_STEP_POOL, export_to_step, shape, filename)
+
+# Material densities (kg/m³)
+_DENSITIES = {
+    'Steel': 7850,
+    'Aluminum': 2700,
+    'Titanium': 4500,
+    'Brass': 8500,
+    'Copper': 8960
+}
+
 def calculate_properties(shape, material='Steel'):
     """Calculate physical properties of the shape"""
     from OCC.Core.GProp import GProp_GProps
@@ -111,16 +163,7 @@ def calculate_properties(shape, material='Steel'):
     
     volume = props.Mass()  # in mm³
     
-    # Material densities (kg/m³)
-    densities = {
-        'Steel': 7850,
-        'Aluminum': 2700,
-        'Titanium': 4500,
-        'Brass': 8500,
-        'Copper': 8960
-    }
-    
-    density = densities.get(material, 7850)
+    density = _DENSITIES.get(material, 7850)
     mass = volume * density / 1e9  # Convert to kg
     
     return {
@@ -2,12 +2,92 @@
 DigiForm CAD Engine Integration Module
 Main interface for the enhanced CAD functionality
 """
+import bisect
+import collections
+import dataclasses
 import json
 import os
+import threading
+from datetime import datetime
 from typing import Dict, Any, Optional, List
-from .cad_engine import ParametricEngine, CADModel, export_stl, export_step, MaterialDatabase, MassProperties
+from .cad_engine import ParametricEngine, CADModel, export_stl, export_step, MaterialDatabase, MassProperties, warm_up
 from .enhanced_nlp import EnhancedNLPParser
-from .pyvista_viewer import CADViewport
+
+# Feature history entries kept per engine; older ones are dropped
+_HISTORY_LIMIT = 64
+
+# Custom-component parameters per parsed feature type; thickness is the base plate's
+_FEATURE_PARAMETERS = {
+    'hole': lambda feature, thickness: {
+        'diameter': feature['diameter'],
+        'x': feature['position'][0],
+        'y': feature['position'][1],
+        'depth': thickness
+    },
+    'fillet': lambda feature, thickness: {'radius': feature['radius'], 'selector': '|Z'},
+    'chamfer': lambda feature, thickness: {'length': feature['length'], 'selector': '|Z'}
+}
+
+# Feature counts up to each threshold rate as the label at the same index; more is 'high'
+_COMPLEXITY_THRESHOLDS = (3, 6)
+_COMPLEXITY_LABELS = ('low', 'medium', 'high')
+
+# Fixed lines of the feature checklist: centerline header per centerline type, and the footer
+_CHECKLIST_CENTERLINE_Z = (
+    "✔ CENTERLINE CREATED: Z-axis (Cylindrical/Symmetric)",
+    "✔ CENTERLINE ORIGIN: (0, 0, 0)",
+    ""
+)
+_CHECKLIST_CENTERLINE_XYZ = (
+    "✔ CENTERLINE CREATED: Orthogonal X,Y,Z axes (Prismatic)",
+    "✔ CENTERLINE ORIGIN: (0, 0, 0)",
+    ""
+)
+_CHECKLIST_FOOTER = (
+    "",
+    "🔍 VALIDATION SUMMARY:",
+    "✔ Centerline created and visible",
+    "✔ Centerline aligned with geometry",
+    "✔ All symmetric features reference centerline"
+)
+
+# Incomplete-gear response; process_natural_language fills in the None entries per request
+_GEAR_ERROR_BASE = {
+    'success': False,
+    'error': 'INCOMPLETE GEAR SPECIFICATION - Gears must NOT be approximated as cylinders',
+    'component_type': 'gear',
+    'missing_parameters': None,
+    'specification_quality': None,
+    'required_info': None,
+    'example_complete_request': 'Create a spur gear with module 2, 20 teeth, 20° pressure angle, 10mm thickness',
+    'errors': None
+}
+_GEAR_REQUIRED_INFO_BASE = {
+    'module': 'e.g., "module 2" (metric tooth size)',
+    'or_diametral_pitch': 'e.g., "diametral pitch 12" or "DP 12"',
+    'teeth': None,
+    'pressure_angle': 'e.g., "20° pressure angle" (standard 20° used if not specified)',
+    'thickness': 'e.g., "10mm thick" (face width)'
+}
+
+def _round_metrics(*values: float) -> tuple:
+    """values rounded to the 2 decimals of a property response, in one vectorized call"""
+    import numpy as np
+    
+    return tuple(np.round(np.array(values, dtype=np.float64), 2).tolist())
+
+@dataclasses.dataclass
+class _HistoryEntry:
+    """One feature_history record: a processed description and the model built from it"""
+    __slots__ = ('description', 'parsed_data', 'model', 'timestamp')
+    description: str
+    parsed_data: Dict[str, Any]
+    model: CADModel
+    timestamp: str
+    
+    def as_dict(self) -> Dict[str, Any]:
+        """Shallow dict form for API responses (dataclasses.asdict would deep-copy the model)"""
+        return {field: getattr(self, field) for field in self.__slots__}
 
 class SimulationController:
     """
@@ -177,31 +257,77 @@ class SimulationController:
 class DigiformCADEngine:
     """Main CAD engine interface for DigiForm"""
     
-    def __init__(self, output_dir: str = "output"):
+    def __init__(self, output_dir: str = "output", eager: bool = False):
+        """
+        The NLP parser and the viewport (and its real-time viewer server) are
+        created on first use, so headless pipelines never start a viewer. With
+        eager=True (server deployments) background threads start the viewport and
+        warm up the parser and the CAD engine's compiled kernels right away.
+        """
         self.output_dir = output_dir
-        self.nlp_parser = EnhancedNLPParser()
-        self.viewport = CADViewport()
+        self._nlp_parser = None
+        self._viewport = None
+        self._viewport_lock = threading.Lock()
+        # (description, preview) of the last successful process_natural_language call and its response
+        self._last_request = None
+        self._last_response = None
         self.current_model = None
-        self.feature_history = []
+        self.feature_history = collections.deque(maxlen=_HISTORY_LIMIT)
         self.simulation_controller = None  # Will be initialized when model is created
         self.material_database = MaterialDatabase()  # Initialize material database
         
         # Ensure output directory exists
         os.makedirs(output_dir, exist_ok=True)
         
-        # Start real-time viewer
-        self.viewport.start_realtime_viewer()
+        if eager:
+            threading.Thread(target=lambda: self.viewport, daemon=True).start()
+            threading.Thread(target=self._warm_up, daemon=True).start()
+    
+    def _warm_up(self):
+        """Pay the parser's and the kernels' first-call costs before the first request"""
+        self._parse("cube 10x10x10")
+        warm_up()
     
-    def process_natural_language(self, description: str) -> Dict[str, Any]:
+    @property
+    def nlp_parser(self) -> EnhancedNLPParser:
+        """Natural language parser, created on first use"""
+        if self._nlp_parser is None:
+            self._nlp_parser = EnhancedNLPParser()
+        return self._nlp_parser
+    
+    @property
+    def viewport(self):
+        """CADViewport with its real-time viewer running, started on first use"""
+        if self._viewport is None:
+            with self._viewport_lock:
+                if self._viewport is None:
+                    # PyVista/VTK is only imported when something is rendered
+                    from .pyvista_viewer import CADViewport
+                    viewport = CADViewport()
+                    viewport.start_realtime_viewer()
+                    self._viewport = viewport
+        return self._viewport
+    
+    def process_natural_language(self, description: str, preview: bool = True) -> Dict[str, Any]:
         """
         Process natural language description into CAD model
         Returns detailed parsing results and model information with centerline validation
         
+        preview=False skips rendering (the response's 'preview' is None), for API
+        callers that only need the JSON properties.
+        
+        Submitting the same description again (double clicks, UI retries) returns the
+        previous response without rebuilding, unless the model was modified since.
+        
         MANDATORY GEAR RULE: If gears are requested, validate that Module/DP and teeth count are specified.
         """
+        request = (description, preview)
+        if request == self._last_request:
+            return self._last_response
+        
         try:
             # Parse the description
-            parsed_data = self.nlp_parser.parse_description(description)
+            parsed_data = self._parse(description)
             
             # GEAR HANDLING RULE: Check for incomplete gear specifications
             if parsed_data['component_type'] == 'gear':
@@ -209,37 +335,25 @@ class DigiformCADEngine:
                 missing_params = parsed_data.get('missing_gear_params', [])
                 
                 if missing_params:
-                    return {
-                        'success': False,
-                        'error': 'INCOMPLETE GEAR SPECIFICATION - Gears must NOT be approximated as cylinders',
-                        'component_type': 'gear',
-                        'missing_parameters': missing_params,
-                        'specification_quality': gear_validation.get('specification_quality', 'INCOMPLETE'),
-                        'required_info': {
-                            'module': 'e.g., "module 2" (metric tooth size)',
-                            'or_diametral_pitch': 'e.g., "diametral pitch 12" or "DP 12"',
-                            'teeth': f"e.g., '20 teeth' (current: {parsed_data['dimensions'].get('teeth', 'NOT SPECIFIED')})",
-                            'pressure_angle': 'e.g., "20° pressure angle" (standard 20° used if not specified)',
-                            'thickness': 'e.g., "10mm thick" (face width)'
-                        },
-                        'example_complete_request': 'Create a spur gear with module 2, 20 teeth, 20° pressure angle, 10mm thickness',
-                        'errors': gear_validation.get('errors', [])
-                    }
+                    response = dict(_GEAR_ERROR_BASE)
+                    response['missing_parameters'] = missing_params
+                    response['specification_quality'] = gear_validation.get('specification_quality', 'INCOMPLETE')
+                    required_info = dict(_GEAR_REQUIRED_INFO_BASE)
+                    required_info['teeth'] = f"e.g., '20 teeth' (current: {parsed_data['dimensions'].get('teeth', 'NOT SPECIFIED')})"
+                    response['required_info'] = required_info
+                    response['errors'] = gear_validation.get('errors', [])
+                    return response
             
             # Create CAD model based on parsed data
             model = self._create_model_from_parsed_data(parsed_data)
             
             if model:
                 self.current_model = model
-                self.feature_history.append({
-                    'description': description,
-                    'parsed_data': parsed_data,
-                    'model': model,
-                    'timestamp': self._get_timestamp()
-                })
+                self.feature_history.append(
+                    _HistoryEntry(description, parsed_data, model, self._get_timestamp()))
                 
                 # Generate preview
-                preview_image = self.viewport.render_model(model)
+                preview_image = self.viewport.render_model(model) if preview else None
                 
                 response = {
                     'success': True,
@@ -258,9 +372,10 @@ class DigiformCADEngine:
                 }
                 
                 # Add gear specifications to response if applicable
-                if parsed_data['component_type'] == 'gear' and hasattr(model, 'gear_specs'):
+                if parsed_data['component_type'] == 'gear' and model.gear_specs is not None:
                     response['gear_specifications'] = model.gear_specs
                 
+                self._last_request, self._last_response = request, response
                 return response
             else:
                 return {
@@ -274,62 +389,78 @@ class DigiformCADEngine:
                 'error': f'Processing error: {str(e)}'
             }
     
+    def _parse(self, description: str) -> Dict[str, Any]:
+        """
+        Parse a description with whitespace collapsed, so descriptions that differ
+        only in case or spacing share one entry in the parser's result cache.
+        """
+        return self.nlp_parser.parse_description(" ".join(description.split()))
+    
     def _create_model_from_parsed_data(self, parsed_data: Dict[str, Any]) -> Optional[CADModel]:
         """Create CAD model from parsed natural language data"""
-        component_type = parsed_data['component_type']
-        parameters = parsed_data['parameters']
-        centerline_type = parsed_data.get('centerline_type', 'XYZ')
-        
         # Map centerline type to model type
-        model_type_map = {
-            'Z': 'cylindrical',
-            'XYZ': 'prismatic'
-        }
-        model_type = model_type_map.get(centerline_type, 'prismatic')
+        model_type = self._MODEL_TYPES.get(parsed_data.get('centerline_type', 'XYZ'), 'prismatic')
+        builder = self._BUILDERS.get(parsed_data['component_type'], DigiformCADEngine._build_default)
         
         try:
-            if component_type == 'gear':
-                return ParametricEngine.create_gear(
-                    teeth=parameters.get('teeth', 20),
-                    module=parameters.get('module', 2.0),
-                    thickness=parameters.get('thickness', 10),
-                    bore_diameter=parameters.get('bore_diameter', 0),
-                    pressure_angle=parameters.get('pressure_angle', 20.0)
-                )
-            elif component_type == 'shaft':
-                return ParametricEngine.create_shaft(
-                    diameter=parameters.get('diameter', 20),
-                    length=parameters.get('length', 100)
-                )
-            elif component_type == 'bracket':
-                # Extract mounting holes
-                mounting_holes = []
-                if 'holes' in parameters:
-                    for hole in parameters['holes']:
-                        mounting_holes.append((
-                            hole['position'][0],
-                            hole['position'][1],
-                            hole['diameter']
-                        ))
-                
-                return ParametricEngine.create_bracket(
-                    width=parameters.get('width', 50),
-                    height=parameters.get('height', 30),
-                    thickness=parameters.get('thickness', 10),
-                    mounting_holes=mounting_holes if mounting_holes else None
-                )
-            elif component_type == 'custom':
-                # Create custom component from features
-                features = self._build_feature_list(parsed_data)
-                return ParametricEngine.create_custom_component(features, model_type=model_type)
-            else:
-                # Default to bracket for unknown types
-                return ParametricEngine.create_bracket(50, 30, 10)
-                
+            return builder(self, parsed_data, model_type)
         except Exception as e:
             print(f"Model creation error: {e}")
             return None
     
+    def _build_gear(self, parsed_data: Dict[str, Any], model_type: str) -> CADModel:
+        parameters = parsed_data['parameters']
+        return ParametricEngine.create_gear(
+            teeth=parameters.get('teeth', 20),
+            module=parameters.get('module', 2.0),
+            thickness=parameters.get('thickness', 10),
+            bore_diameter=parameters.get('bore_diameter', 0),
+            pressure_angle=parameters.get('pressure_angle', 20.0)
+        )
+    
+    def _build_shaft(self, parsed_data: Dict[str, Any], model_type: str) -> CADModel:
+        parameters = parsed_data['parameters']
+        return ParametricEngine.create_shaft(
+            diameter=parameters.get('diameter', 20),
+            length=parameters.get('length', 100)
+        )
+    
+    def _build_bracket(self, parsed_data: Dict[str, Any], model_type: str) -> CADModel:
+        parameters = parsed_data['parameters']
+        # Extract mounting holes
+        mounting_holes = [
+            (hole['position'][0], hole['position'][1], hole['diameter'])
+            for hole in parameters.get('holes', ())
+        ]
+        
+        return ParametricEngine.create_bracket(
+            width=parameters.get('width', 50),
+            height=parameters.get('height', 30),
+            thickness=parameters.get('thickness', 10),
+            mounting_holes=mounting_holes if mounting_holes else None
+        )
+    
+    def _build_custom(self, parsed_data: Dict[str, Any], model_type: str) -> CADModel:
+        # Create custom component from features
+        features = self._build_feature_list(parsed_data)
+        return ParametricEngine.create_custom_component(features, model_type=model_type)
+    
+    def _build_default(self, parsed_data: Dict[str, Any], model_type: str) -> CADModel:
+        # Default to bracket for unknown types
+        return ParametricEngine.create_bracket(50, 30, 10)
+    
+    # Component type -> model builder; anything else gets _build_default
+    _BUILDERS = {
+        'gear': _build_gear,
+        'shaft': _build_shaft,
+        'bracket': _build_bracket,
+        'custom': _build_custom
+    }
+    _MODEL_TYPES = {
+        'Z': 'cylindrical',
+        'XYZ': 'prismatic'
+    }
+    
     def _build_feature_list(self, parsed_data: Dict[str, Any]) -> List[Dict]:
         """Build feature list for custom components"""
         features = []
@@ -355,51 +486,35 @@ class DigiformCADEngine:
             }
         })
         
-        # Add holes
-        for feature in parsed_data['features']:
-            if feature['type'] == 'hole':
-                features.append({
-                    'type': 'hole',
-                    'name': f'hole_{len(features)}',
-                    'parameters': {
-                        'diameter': feature['diameter'],
-                        'x': feature['position'][0],
-                        'y': feature['position'][1],
-                        'depth': dims.get('thickness', 10)
-                    }
-                })
-            elif feature['type'] == 'fillet':
-                features.append({
-                    'type': 'fillet',
-                    'name': f'fillet_{len(features)}',
-                    'parameters': {
-                        'radius': feature['radius'],
-                        'selector': '|Z'
-                    }
-                })
-            elif feature['type'] == 'chamfer':
-                features.append({
-                    'type': 'chamfer',
-                    'name': f'chamfer_{len(features)}',
-                    'parameters': {
-                        'length': feature['length'],
-                        'selector': '|Z'
-                    }
-                })
+        # Add holes, fillets and chamfers in the order they were described,
+        # named by their position in the feature list
+        thickness = dims.get('thickness', 10)
+        supported = [feature for feature in parsed_data['features'] if feature['type'] in _FEATURE_PARAMETERS]
+        features.extend({
+            'type': feature['type'],
+            'name': f"{feature['type']}_{index}",
+            'parameters': _FEATURE_PARAMETERS[feature['type']](feature, thickness)
+        } for index, feature in enumerate(supported, start=len(features)))
         
         return features
     
-    def modify_model(self, modifications: str) -> Dict[str, Any]:
-        """Modify current model based on natural language modifications"""
+    def modify_model(self, modifications: str, preview: bool = True) -> Dict[str, Any]:
+        """
+        Modify current model based on natural language modifications.
+        preview=False skips rendering, as in process_natural_language.
+        """
         if not self.current_model:
             return {
                 'success': False,
                 'error': 'No current model to modify'
             }
         
+        # The current model is about to change; a repeated description must rebuild
+        self._last_request = self._last_response = None
+        
         try:
             # Parse modifications
-            mod_parsed = self.nlp_parser.parse_description(modifications)
+            mod_parsed = self._parse(modifications)
             
             # Apply modifications to current model
             # This is a simplified implementation - full parametric modification
@@ -408,7 +523,7 @@ class DigiformCADEngine:
             
             if modified_model:
                 self.current_model = modified_model
-                preview_image = self.viewport.render_model(modified_model)
+                preview_image = self.viewport.render_model(modified_model) if preview else None
                 
                 return {
                     'success': True,
@@ -440,6 +555,13 @@ class DigiformCADEngine:
         # For now, create new model with modified parameters
         return self._create_model_from_parsed_data(modifications)
     
+    # Export format -> writer; OBJ is recognized but not implemented yet
+    _EXPORTERS = {
+        'stl': export_stl,
+        'step': export_step,
+        'obj': None
+    }
+    
     def export_model(self, format: str = 'stl', filename: Optional[str] = None) -> Dict[str, Any]:
         """Export current model to specified format"""
         if not self.current_model:
@@ -448,31 +570,32 @@ class DigiformCADEngine:
                 'error': 'No model to export'
             }
         
+        fmt = format.lower()
+        if fmt not in self._EXPORTERS:
+            return {
+                'success': False,
+                'error': f'Unsupported format: {format}'
+            }
+        
         try:
             if not filename:
-                filename = f"model_{self._get_timestamp()}.{format.lower()}"
+                filename = f"model_{self._get_timestamp()}.{fmt}"
             
             filepath = os.path.join(self.output_dir, filename)
-            
-            if format.lower() == 'stl':
-                success = export_stl(self.current_model, filepath)
-            elif format.lower() == 'step':
-                success = export_step(self.current_model, filepath)
-            elif format.lower() == 'obj':
-                # Would need additional implementation
-                success = False
-            else:
-                return {
-                    'success': False,
-                    'error': f'Unsupported format: {format}'
-                }
+            exporter = self._EXPORTERS[fmt]
+            success = exporter(self.current_model, filepath) if exporter else False
             
             if success:
+                # One stat call; a missing file reports size 0
+                try:
+                    size = os.stat(filepath).st_size
+                except OSError:
+                    size = 0
                 return {
                     'success': True,
                     'filepath': filepath,
                     'format': format,
-                    'size': os.path.getsize(filepath) if os.path.exists(filepath) else 0
+                    'size': size
                 }
             else:
                 return {
@@ -495,53 +618,31 @@ class DigiformCADEngine:
     
     def _get_model_properties(self, model: CADModel) -> Dict[str, Any]:
         """Extract model properties"""
-        bbox = model.get_bounding_box()
-        volume = model.get_volume()
-        mass = model.get_mass()
+        bbox, volume, mass, surface_area, feature_count = model.get_metrics()
+        length, width, height, volume, mass, surface_area = _round_metrics(*bbox, volume, mass, surface_area)
         
         return {
             'bounding_box': {
-                'length': round(bbox[0], 2),
-                'width': round(bbox[1], 2),
-                'height': round(bbox[2], 2)
+                'length': length,
+                'width': width,
+                'height': height
             },
-            'volume': round(volume, 2),
-            'mass': round(mass, 2),
-            'surface_area': round(self._calculate_surface_area(model), 2),
-            'feature_count': len(model.features),
+            'volume': volume,
+            'mass': mass,
+            'surface_area': surface_area,
+            'feature_count': feature_count,
             'complexity': self._assess_complexity(model)
         }
     
-    def _calculate_surface_area(self, model: CADModel) -> float:
-        """Calculate approximate surface area"""
-        # Simplified calculation - would need proper mesh analysis for accuracy
-        bbox = model.get_bounding_box()
-        # Approximate as rectangular prism surface area
-        l, w, h = bbox
-        return 2 * (l*w + l*h + w*h)
-    
     def _assess_complexity(self, model: CADModel) -> str:
         """Assess model complexity"""
-        feature_count = len(model.features)
-        if feature_count <= 3:
-            return 'low'
-        elif feature_count <= 6:
-            return 'medium'
-        else:
-            return 'high'
+        return _COMPLEXITY_LABELS[bisect.bisect_left(_COMPLEXITY_THRESHOLDS, len(model.features))]
     
     def _generate_feature_checklist(self, parsed_data: Dict[str, Any]) -> List[str]:
         """Generate feature checklist from parsed data with centerline validation"""
-        checklist = []
-        
         # Centerline validation header
         centerline_type = parsed_data.get('centerline_type', 'XYZ')
-        if centerline_type == 'Z':
-            checklist.append("✔ CENTERLINE CREATED: Z-axis (Cylindrical/Symmetric)")
-        else:
-            checklist.append("✔ CENTERLINE CREATED: Orthogonal X,Y,Z axes (Prismatic)")
-        checklist.append("✔ CENTERLINE ORIGIN: (0, 0, 0)")
-        checklist.append("")
+        checklist = list(_CHECKLIST_CENTERLINE_Z if centerline_type == 'Z' else _CHECKLIST_CENTERLINE_XYZ)
         
         # Component type
         checklist.append(f"✓ Component type: {parsed_data['component_type']}")
@@ -575,11 +676,7 @@ class DigiformCADEngine:
             checklist.append(f"✓ {constraint['type']} constraint applied")
         
         # Validation summary
-        checklist.append("")
-        checklist.append("🔍 VALIDATION SUMMARY:")
-        checklist.append("✔ Centerline created and visible")
-        checklist.append("✔ Centerline aligned with geometry")
-        checklist.append("✔ All symmetric features reference centerline")
+        checklist.extend(_CHECKLIST_FOOTER)
         
         return checklist
     
@@ -601,12 +698,20 @@ class DigiformCADEngine:
     
     def _get_timestamp(self) -> str:
         """Get current timestamp for file naming"""
-        from datetime import datetime
         return datetime.now().strftime("%Y%m%d_%H%M%S")
     
+    def render_history_previews(self) -> List[str]:
+        """
+        Preview images of every model in the feature history, oldest first. They are
+        rendered one after another on the viewport's render thread: off-screen GL
+        contexts are not thread-safe, so there is nothing to gain from more threads.
+        """
+        viewport = self.viewport
+        return [viewport.render_model(entry.model) for entry in self.feature_history]
+    
     def get_feature_history(self) -> List[Dict[str, Any]]:
-        """Get history of all created/modified models"""
-        return self.feature_history
+        """Get history of the most recent created/modified models, oldest first"""
+        return [entry.as_dict() for entry in self.feature_history]
     
     def run_simulation(self, simulation_type: str = 'mass_properties', 
                       parameters: Dict[str, Any] = None) -> Dict[str, Any]:
@@ -665,7 +770,9 @@ class DigiformCADEngine:
     
     def close(self):
         """Clean up resources"""
-        self.viewport.close()
+        self._last_request = self._last_response = None
+        if self._viewport is not None:
+            self._viewport.close()
 
 # Example usage and testing
 if __name__ == "__main__":
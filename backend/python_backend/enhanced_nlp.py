@@ -2,14 +2,147 @@
 Enhanced NLP Parser for DigiForm CAD Engine
 Extracts complex CAD features, dimensions, and constraints from natural language
 """
+import functools
 import re
-from typing import Dict, List, Tuple, Optional, Any
+from typing import Dict, List, Sequence, Tuple, Optional, Any
 import math
 
+# Material keyword -> name, in priority order when several are mentioned
+_MATERIAL_NAMES = {
+    'steel': 'Steel',
+    'aluminum': 'Aluminum',
+    'aluminium': 'Aluminum',
+    'titanium': 'Titanium',
+    'brass': 'Brass',
+    'copper': 'Copper',
+    'plastic': 'Plastic',
+}
+
+
+_DIGIT = re.compile(r'\d')
+
+# Unit bucket in dimension_patterns -> factor to mm
+_UNIT_SCALE = {'mm': 1.0, 'cm': 10.0, 'inch': 25.4}
+
+# Fallback values when a description names a feature but not its size or
+# position; shared immutable tuples, since callers only index or iterate them
+_DEFAULT_HOLE_SIZES = (10.0,)
+_DEFAULT_HOLE_POSITIONS = ((0, 0),)  # center
+_DEFAULT_RADII = (2.0,)
+_DEFAULT_CHAMFER_LENGTHS = (1.0,)
+_DEFAULT_DISTANCES = (5.0,)
+
+def _gear_parameters(dims: Dict[str, Any]) -> Dict[str, Any]:
+    teeth = dims.get('teeth', 20)
+    module = dims.get('module', 2.0)
+    return {
+        'teeth': teeth,
+        'module': module,
+        'thickness': dims.get('thickness', dims.get('height', 10)),
+        'pitch_diameter': module * teeth
+    }
+
+def _shaft_parameters(dims: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        'diameter': dims.get('diameter', dims.get('width', 20)),
+        'length': dims.get('length', 100)
+    }
+
+def _bracket_parameters(dims: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        'width': dims.get('width', 50),
+        'height': dims.get('height', 30),
+        'thickness': dims.get('thickness', dims.get('depth', 10))
+    }
+
+# Component type -> parameter builder; other types only get feature parameters
+_COMPONENT_PARAMETERS = {
+    'gear': _gear_parameters,
+    'shaft': _shaft_parameters,
+    'bracket': _bracket_parameters,
+}
+
+def _add_hole(params: Dict[str, Any], feature: Dict[str, Any]):
+    params.setdefault('holes', []).append({
+        'diameter': feature['diameter'],
+        'position': feature['position']
+    })
+
+def _set_fillet(params: Dict[str, Any], feature: Dict[str, Any]):
+    params['fillet_radius'] = feature['radius']
+
+def _set_chamfer(params: Dict[str, Any], feature: Dict[str, Any]):
+    params['chamfer_length'] = feature['length']
+
+# Feature type -> how it lands in the parameters dict
+_FEATURE_APPLIERS = {
+    'hole': _add_hole,
+    'fillet': _set_fillet,
+    'chamfer': _set_chamfer,
+}
+
+# Whole-word keyword classes read by the feature, pattern, constraint and
+# centerline detectors
+_KEYWORDS = {
+    'hole': ('hole', 'bore', 'drill'),
+    'fillet': ('fillet', 'round'),
+    'chamfer': ('chamfer', 'bevel'),
+    'circular': ('circular', 'around'),
+    'linear': ('linear', 'in a line', 'row of'),
+    'centered': ('center', 'centered', 'middle', 'central'),
+    'offset': ('offset', 'from edge', 'from center', 'distance'),
+    'centerline': ('cylinder', 'cylindrical', 'round', 'shaft', 'axle', 'drill',
+                   'symmetric', 'symmetrical', 'centered', 'circular pattern',
+                   'revolve', 'revolving', 'rotational', 'rotation',
+                   'bore', 'inner', 'hole'),
+}
+
+
+def _is_whole_word(text: str, start: int, end: int) -> bool:
+    """Regex word-boundary test on both ends of text[start:end]"""
+    return ((start == 0 or not (text[start - 1].isalnum() or text[start - 1] == '_')) and
+            (end == len(text) or not (text[end].isalnum() or text[end] == '_')))
+
+def _count_words(text: str, words: Tuple[str, ...]) -> int:
+    """Count whole-word occurrences of any of words (literal str.find scan)"""
+    count = 0
+    for word in words:
+        start = text.find(word)
+        while start != -1:
+            if _is_whole_word(text, start, start + len(word)):
+                count += 1
+            start = text.find(word, start + 1)
+    return count
+
+def _has_word(text: str, words: Tuple[str, ...]) -> bool:
+    """True if any of words occurs in text as a whole word"""
+    for word in words:
+        start = text.find(word)
+        while start != -1:
+            if _is_whole_word(text, start, start + len(word)):
+                return True
+            start = text.find(word, start + 1)
+    return False
+
+def _copy_result(value):
+    """Copy a parse result: dicts and lists are rebuilt, everything else is immutable"""
+    if isinstance(value, dict):
+        return {key: _copy_result(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_copy_result(item) for item in value]
+    return value
+
+def _compile_all(*patterns: str) -> List['re.Pattern']:
+    """Compile patterns in order (they run on lowercased text)"""
+    return [re.compile(pattern) for pattern in patterns]
+
 class EnhancedNLPParser:
     """Advanced NLP parser for CAD feature extraction"""
     
     def __init__(self):
+        # parse_description results per lowercased description
+        self._parse_cached = functools.lru_cache(maxsize=1024)(self._parse)
+        
         # Enhanced pattern definitions
         self.dimension_patterns = {
             'mm': re.compile(r'(\d+\.?\d*)\s*mm', re.IGNORECASE),
@@ -21,35 +154,6 @@ class EnhancedNLPParser:
             'height': re.compile(r'(?:height|h|thick|thickness|t)\s*(?:of\s*)?(\d+\.?\d*)\s*(?:mm|cm|inch)', re.IGNORECASE),
         }
         
-        self.feature_patterns = {
-            'hole': re.compile(r'\b(hole|bore|drill)\b', re.IGNORECASE),
-            'fillet': re.compile(r'\b(fillet|round)\b', re.IGNORECASE),
-            'chamfer': re.compile(r'\b(chamfer|bevel)\b', re.IGNORECASE),
-            'pocket': re.compile(r'\b(pocket|cavity|recess)\b', re.IGNORECASE),
-            'slot': re.compile(r'\b(slot|groove)\b', re.IGNORECASE),
-            'rib': re.compile(r'\b(rib|web|spoke)\b', re.IGNORECASE),
-        }
-        
-        self.pattern_patterns = {
-            'circular': re.compile(r'\b(circular|around|circular pattern)\b', re.IGNORECASE),
-            'linear': re.compile(r'\b(linear|in a line|row of)\b', re.IGNORECASE),
-            'mirror': re.compile(r'\b(mirror|symmetric|symmetrical)\b', re.IGNORECASE),
-        }
-        
-        self.constraint_patterns = {
-            'centered': re.compile(r'\b(center|centered|middle|central)\b', re.IGNORECASE),
-            'offset': re.compile(r'\b(offset|from edge|from center|distance)\b', re.IGNORECASE),
-            'aligned': re.compile(r'\b(aligned|parallel|perpendicular)\b', re.IGNORECASE),
-        }
-        
-        # Centerline/axis patterns
-        self.centerline_patterns = {
-            'cylindrical': re.compile(r'\b(cylinder|cylindrical|round|shaft|axle|drill)\b', re.IGNORECASE),
-            'symmetric': re.compile(r'\b(symmetric|symmetrical|centered|circular pattern)\b', re.IGNORECASE),
-            'revolve': re.compile(r'\b(revolve|revolving|rotational|rotation)\b', re.IGNORECASE),
-            'bore': re.compile(r'\b(bore|inner|hole|drill)\b', re.IGNORECASE),
-        }
-        
         # Gear-specific patterns (MANDATORY RULE)
         self.gear_patterns = {
             'module': re.compile(r'module\s*(?:=\s*)?(\d+\.?\d*)', re.IGNORECASE),
@@ -57,27 +161,83 @@ class EnhancedNLPParser:
             'pressure_angle': re.compile(r'(?:pressure\s*angle|pressure\s+angle)\s*(?:=\s*)?(\d+\.?\d*)\s*(?:°|degree|deg)?', re.IGNORECASE),
             'teeth': re.compile(r'(\d+)\s*(?:teeth|tooth|t\b)', re.IGNORECASE),
         }
+        
+        # Value extractors, compiled once rather than per call; the parametric
+        # ones are keyed by the feature/pattern type they are called with.
+        # They only ever see lowercased text, so they skip re.IGNORECASE.
+        self._box_pattern = re.compile(r'(\d+\.?\d*)\s*x\s*(\d+\.?\d*)\s*(?:x\s*(\d+\.?\d*))?\s*(?:mm|cm|inch)')
+        self._teeth_count_pattern = re.compile(r'(\d+)\s*(?:teeth|tooth)')
+        self._module_value_pattern = re.compile(r'module\s*(\d+\.?\d*)')
+        self._coord_pattern = re.compile(r'\((\d+\.?\d*)\s*,\s*(\d+\.?\d*)\)')
+        self._hole_size_patterns = _compile_all(
+            r'(\d+\.?\d*)\s*mm\s*hole',
+            r'hole\s*(?:of\s*)?(\d+\.?\d*)\s*mm',
+            r'(\d+\.?\d*)\s*mm\s*diameter\s*hole',
+        )
+        self._chamfer_length_patterns = _compile_all(
+            r'chamfer\s*length\s*(\d+\.?\d*)\s*mm',
+            r'(\d+\.?\d*)\s*mm\s*chamfer',
+        )
+        self._spacing_patterns = _compile_all(
+            r'spaced\s*(\d+\.?\d*)\s*mm\s*apart',
+            r'(\d+\.?\d*)\s*mm\s*spacing',
+            r'spacing\s*of\s*(\d+\.?\d*)\s*mm',
+        )
+        self._distance_patterns = _compile_all(
+            r'(\d+\.?\d*)\s*mm\s*from',
+            r'offset\s*(\d+\.?\d*)\s*mm',
+            r'distance\s*of\s*(\d+\.?\d*)\s*mm',
+        )
+        self._radius_patterns = {
+            name: _compile_all(
+                rf'{name}\s*radius\s*(\d+\.?\d*)\s*mm',
+                rf'(\d+\.?\d*)\s*mm\s*{name}\s*radius',
+            )
+            for name in ('fillet', 'circular')
+        }
+        self._count_patterns = {
+            name: _compile_all(
+                rf'(\d+)\s*{name}',
+                rf'{name}\s*of\s*(\d+)',
+                rf'(\d+)\s*(?:holes?|items?|elements?)\s*in\s*{name}',
+            )
+            for name in ('circular', 'linear')
+        }
     
     def parse_description(self, description: str) -> Dict[str, Any]:
-        """Parse natural language description into CAD features"""
-        component_type = self._detect_component_type(description)
+        """
+        Parse natural language description into CAD features.
+        
+        Results are cached per lowercased description; each call returns its own
+        copy, so callers may mutate it freely.
+        """
+        # Lowercased once here; every helper below expects lowercased text
+        return _copy_result(self._parse_cached(description.lower()))
+    
+    def clear_cache(self):
+        """Drop cached parse results"""
+        self._parse_cached.cache_clear()
+    
+    def _parse(self, text: str) -> Dict[str, Any]:
+        """Uncached parse of an already lowercased description"""
+        component_type = self._detect_component_type(text)
         
         result = {
             'component_type': component_type,
             'base_features': [],
             'modifiers': [],
-            'dimensions': self._extract_dimensions(description),
-            'features': self._extract_features(description),
-            'patterns': self._extract_patterns(description),
-            'constraints': self._extract_constraints(description),
-            'material': self._extract_material(description),
-            'centerline_type': self._detect_centerline_type(description),
+            'dimensions': self._extract_dimensions(text),
+            'features': self._extract_features(text),
+            'patterns': self._extract_patterns(text),
+            'constraints': self._extract_constraints(text),
+            'material': self._extract_material(text),
+            'centerline_type': self._detect_centerline_type(text),
             'parameters': {}
         }
         
         # GEAR HANDLING RULE: Validate gear parameters are properly specified
         if component_type == 'gear':
-            gear_validation = self._validate_gear_parameters(description, result['dimensions'])
+            gear_validation = self._validate_gear_parameters(text, result['dimensions'])
             result['gear_validation'] = gear_validation
             result['missing_gear_params'] = gear_validation['missing_parameters']
         
@@ -88,36 +248,27 @@ class EnhancedNLPParser:
     
     def _detect_centerline_type(self, text: str) -> str:
         """Detect required centerline type (Z-axis or XYZ orthogonal)"""
-        text_lower = text.lower()
-        
-        # Check for cylindrical/symmetric patterns
-        is_cylindrical = any(self.centerline_patterns['cylindrical'].search(text_lower) for _ in [None])
-        is_symmetric = any(self.centerline_patterns['symmetric'].search(text_lower) for _ in [None])
-        is_revolve = any(self.centerline_patterns['revolve'].search(text_lower) for _ in [None])
-        has_bore = self.centerline_patterns['bore'].search(text_lower)
-        
-        if is_cylindrical or is_symmetric or is_revolve or has_bore:
+        # Any cylindrical, symmetric, revolve or bore keyword implies a single axis
+        if _has_word(text, _KEYWORDS['centerline']):
             return 'Z'  # Single Z-axis for cylindrical/symmetric
         else:
             return 'XYZ'  # Orthogonal axes for prismatic parts
     
     def _detect_component_type(self, text: str) -> str:
         """Detect the main component type"""
-        text_lower = text.lower()
-        
-        if 'gear' in text_lower:
+        if 'gear' in text:
             return 'gear'
-        elif 'shaft' in text_lower or 'axle' in text_lower:
+        elif 'shaft' in text or 'axle' in text:
             return 'shaft'
-        elif 'bearing' in text_lower:
+        elif 'bearing' in text:
             return 'bearing'
-        elif 'bracket' in text_lower or 'mount' in text_lower:
+        elif 'bracket' in text or 'mount' in text:
             return 'bracket'
-        elif 'plate' in text_lower:
+        elif 'plate' in text:
             return 'plate'
-        elif 'bolt' in text_lower or 'screw' in text_lower:
+        elif 'bolt' in text or 'screw' in text:
             return 'bolt'
-        elif 'housing' in text_lower or 'enclosure' in text_lower:
+        elif 'housing' in text or 'enclosure' in text:
             return 'housing'
         else:
             return 'custom'
@@ -197,23 +348,22 @@ class EnhancedNLPParser:
     def _extract_dimensions(self, text: str) -> Dict[str, float]:
         """Extract all dimensions from text"""
         dimensions = {}
+        # Every dimension pattern needs a number; skip the scans for text without one
+        if not _DIGIT.search(text):
+            return dimensions
         
         # Extract basic dimensions
         for dim_type, pattern in self.dimension_patterns.items():
             matches = pattern.findall(text)
             if matches:
-                if dim_type == 'mm':
-                    dimensions[dim_type] = [float(m) for m in matches]
-                elif dim_type == 'cm':
-                    dimensions[dim_type] = [float(m) * 10 for m in matches]  # Convert to mm
-                elif dim_type == 'inch':
-                    dimensions[dim_type] = [float(m) * 25.4 for m in matches]  # Convert to mm
+                scale = _UNIT_SCALE.get(dim_type)
+                if scale is not None:
+                    dimensions[dim_type] = [float(m) * scale for m in matches]  # Convert to mm
                 else:
                     dimensions[dim_type] = float(matches[0])
         
         # Extract dimension patterns (WxHxD)
-        dim_pattern = re.compile(r'(\d+\.?\d*)\s*x\s*(\d+\.?\d*)\s*(?:x\s*(\d+\.?\d*))?\s*(?:mm|cm|inch)', re.IGNORECASE)
-        dim_match = dim_pattern.search(text)
+        dim_match = self._box_pattern.search(text)
         if dim_match:
             dimensions['width'] = float(dim_match.group(1))
             dimensions['height'] = float(dim_match.group(2))
@@ -221,12 +371,12 @@ class EnhancedNLPParser:
                 dimensions['depth'] = float(dim_match.group(3))
         
         # Extract teeth count for gears
-        teeth_match = re.search(r'(\d+)\s*(?:teeth|tooth)', text, re.IGNORECASE)
+        teeth_match = self._teeth_count_pattern.search(text)
         if teeth_match:
             dimensions['teeth'] = int(teeth_match.group(1))
         
         # Extract module for gears
-        module_match = re.search(r'module\s*(\d+\.?\d*)', text, re.IGNORECASE)
+        module_match = self._module_value_pattern.search(text)
         if module_match:
             dimensions['module'] = float(module_match.group(1))
         
@@ -235,15 +385,14 @@ class EnhancedNLPParser:
     def _extract_features(self, text: str) -> List[Dict[str, Any]]:
         """Extract CAD features (holes, fillets, chamfers, etc.)"""
         features = []
-        text_lower = text.lower()
+        hole_count = _count_words(text, _KEYWORDS['hole'])
         
         # Extract holes
-        hole_matches = list(self.feature_patterns['hole'].finditer(text_lower))
-        if hole_matches:
+        if hole_count:
             hole_sizes = self._extract_hole_sizes(text)
             hole_positions = self._extract_hole_positions(text)
             
-            for i, match in enumerate(hole_matches):
+            for i in range(hole_count):
                 features.append({
                     'type': 'hole',
                     'diameter': hole_sizes[i] if i < len(hole_sizes) else 10,
@@ -252,8 +401,7 @@ class EnhancedNLPParser:
                 })
         
         # Extract fillets
-        fillet_matches = list(self.feature_patterns['fillet'].finditer(text_lower))
-        if fillet_matches:
+        if _has_word(text, _KEYWORDS['fillet']):
             fillet_radii = self._extract_radii(text, 'fillet')
             for radius in fillet_radii:
                 features.append({
@@ -263,8 +411,7 @@ class EnhancedNLPParser:
                 })
         
         # Extract chamfers
-        chamfer_matches = list(self.feature_patterns['chamfer'].finditer(text_lower))
-        if chamfer_matches:
+        if _has_word(text, _KEYWORDS['chamfer']):
             chamfer_lengths = self._extract_chamfer_lengths(text)
             for length in chamfer_lengths:
                 features.append({
@@ -278,10 +425,9 @@ class EnhancedNLPParser:
     def _extract_patterns(self, text: str) -> List[Dict[str, Any]]:
         """Extract pattern information (circular, linear, mirror)"""
         patterns = []
-        text_lower = text.lower()
         
         # Circular patterns
-        if self.pattern_patterns['circular'].search(text_lower):
+        if _has_word(text, _KEYWORDS['circular']):
             count = self._extract_count(text, 'circular')
             radius = self._extract_radius_from_context(text, 'circular')
             patterns.append({
@@ -291,7 +437,7 @@ class EnhancedNLPParser:
             })
         
         # Linear patterns
-        if self.pattern_patterns['linear'].search(text_lower):
+        if _has_word(text, _KEYWORDS['linear']):
             count = self._extract_count(text, 'linear')
             spacing = self._extract_spacing(text)
             direction = self._extract_direction(text)
@@ -307,18 +453,16 @@ class EnhancedNLPParser:
     def _extract_constraints(self, text: str) -> List[Dict[str, Any]]:
         """Extract geometric constraints"""
         constraints = []
-        text_lower = text.lower()
         
         # Centered constraints
-        if self.constraint_patterns['centered'].search(text_lower):
+        if _has_word(text, _KEYWORDS['centered']):
             constraints.append({
                 'type': 'centered',
                 'reference': 'origin'  # Default to origin
             })
         
         # Offset constraints
-        offset_matches = list(self.constraint_patterns['offset'].finditer(text_lower))
-        if offset_matches:
+        if _has_word(text, _KEYWORDS['offset']):
             distances = self._extract_distances(text)
             for distance in distances:
                 constraints.append({
@@ -331,89 +475,41 @@ class EnhancedNLPParser:
     
     def _extract_material(self, text: str) -> str:
         """Extract material information"""
-        text_lower = text.lower()
-        
-        if 'steel' in text_lower:
-            return 'Steel'
-        elif 'aluminum' in text_lower or 'aluminium' in text_lower:
-            return 'Aluminum'
-        elif 'titanium' in text_lower:
-            return 'Titanium'
-        elif 'brass' in text_lower:
-            return 'Brass'
-        elif 'copper' in text_lower:
-            return 'Copper'
-        elif 'plastic' in text_lower:
-            return 'Plastic'
-        else:
-            return 'Steel'  # Default
+        for keyword, name in _MATERIAL_NAMES.items():
+            if keyword in text:
+                return name
+        return 'Steel'  # Default
     
-    def _extract_hole_sizes(self, text: str) -> List[float]:
+    def _extract_hole_sizes(self, text: str) -> Sequence[float]:
         """Extract hole diameters"""
-        sizes = []
         # Look for patterns like "10mm hole", "hole 10mm diameter", etc.
-        patterns = [
-            r'(\d+\.?\d*)\s*mm\s*hole',
-            r'hole\s*(?:of\s*)?(\d+\.?\d*)\s*mm',
-            r'(\d+\.?\d*)\s*mm\s*diameter\s*hole'
-        ]
-        
-        for pattern in patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            sizes.extend([float(m) for m in matches])
+        sizes = [float(m) for pattern in self._hole_size_patterns for m in pattern.findall(text)]
         
-        return sizes if sizes else [10.0]  # Default hole size
+        return sizes or _DEFAULT_HOLE_SIZES
     
-    def _extract_hole_positions(self, text: str) -> List[Tuple[float, float]]:
+    def _extract_hole_positions(self, text: str) -> Sequence[Tuple[float, float]]:
         """Extract hole positions"""
-        positions = []
         # Look for coordinate patterns
-        coord_pattern = r'\((\d+\.?\d*)\s*,\s*(\d+\.?\d*)\)'
-        matches = re.findall(coord_pattern, text)
+        positions = [(float(x), float(y)) for x, y in self._coord_pattern.findall(text)]
         
-        for match in matches:
-            positions.append((float(match[0]), float(match[1])))
-        
-        return positions if positions else [(0, 0)]  # Default center position
+        return positions or _DEFAULT_HOLE_POSITIONS
     
-    def _extract_radii(self, text: str, feature_type: str) -> List[float]:
+    def _extract_radii(self, text: str, feature_type: str) -> Sequence[float]:
         """Extract radii for fillets/chamfers"""
-        radii = []
-        patterns = [
-            rf'{feature_type}\s*radius\s*(\d+\.?\d*)\s*mm',
-            rf'(\d+\.?\d*)\s*mm\s*{feature_type}\s*radius'
-        ]
-        
-        for pattern in patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            radii.extend([float(m) for m in matches])
+        radii = [float(m) for pattern in self._radius_patterns[feature_type] for m in pattern.findall(text)]
         
-        return radii if radii else [2.0]  # Default radius
+        return radii or _DEFAULT_RADII
     
-    def _extract_chamfer_lengths(self, text: str) -> List[float]:
+    def _extract_chamfer_lengths(self, text: str) -> Sequence[float]:
         """Extract chamfer lengths"""
-        lengths = []
-        patterns = [
-            r'chamfer\s*length\s*(\d+\.?\d*)\s*mm',
-            r'(\d+\.?\d*)\s*mm\s*chamfer'
-        ]
+        lengths = [float(m) for pattern in self._chamfer_length_patterns for m in pattern.findall(text)]
         
-        for pattern in patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            lengths.extend([float(m) for m in matches])
-        
-        return lengths if lengths else [1.0]  # Default chamfer length
+        return lengths or _DEFAULT_CHAMFER_LENGTHS
     
     def _extract_count(self, text: str, pattern_type: str) -> int:
         """Extract count for patterns"""
-        count_patterns = [
-            rf'(\d+)\s*{pattern_type}',
-            rf'{pattern_type}\s*of\s*(\d+)',
-            rf'(\d+)\s*(?:holes?|items?|elements?)\s*in\s*{pattern_type}'
-        ]
-        
-        for pattern in count_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in self._count_patterns[pattern_type]:
+            match = pattern.search(text)
             if match:
                 return int(match.group(1))
         
@@ -421,13 +517,8 @@ class EnhancedNLPParser:
     
     def _extract_radius_from_context(self, text: str, pattern_type: str) -> float:
         """Extract radius from context for circular patterns"""
-        radius_patterns = [
-            rf'{pattern_type}\s*radius\s*(\d+\.?\d*)\s*mm',
-            rf'(\d+\.?\d*)\s*mm\s*{pattern_type}\s*radius'
-        ]
-        
-        for pattern in radius_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in self._radius_patterns[pattern_type]:
+            match = pattern.search(text)
             if match:
                 return float(match.group(1))
         
@@ -435,14 +526,8 @@ class EnhancedNLPParser:
     
     def _extract_spacing(self, text: str) -> float:
         """Extract spacing for linear patterns"""
-        spacing_patterns = [
-            r'spaced\s*(\d+\.?\d*)\s*mm\s*apart',
-            r'(\d+\.?\d*)\s*mm\s*spacing',
-            r'spacing\s*of\s*(\d+\.?\d*)\s*mm'
-        ]
-        
-        for pattern in spacing_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in self._spacing_patterns:
+            match = pattern.search(text)
             if match:
                 return float(match.group(1))
         
@@ -450,64 +535,30 @@ class EnhancedNLPParser:
     
     def _extract_direction(self, text: str) -> str:
         """Extract direction for linear patterns"""
-        if 'horizontal' in text.lower() or 'x direction' in text.lower():
+        if 'horizontal' in text or 'x direction' in text:
             return 'X'
-        elif 'vertical' in text.lower() or 'y direction' in text.lower():
+        elif 'vertical' in text or 'y direction' in text:
             return 'Y'
         else:
             return 'X'  # Default direction
     
-    def _extract_distances(self, text: str) -> List[float]:
+    def _extract_distances(self, text: str) -> Sequence[float]:
         """Extract distances for offset constraints"""
-        distances = []
-        patterns = [
-            r'(\d+\.?\d*)\s*mm\s*from',
-            r'offset\s*(\d+\.?\d*)\s*mm',
-            r'distance\s*of\s*(\d+\.?\d*)\s*mm'
-        ]
-        
-        for pattern in patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            distances.extend([float(m) for m in matches])
+        distances = [float(m) for pattern in self._distance_patterns for m in pattern.findall(text)]
         
-        return distances if distances else [5.0]  # Default distance
+        return distances or _DEFAULT_DISTANCES
     
     def _build_parameters(self, parsed_data: Dict[str, Any]) -> Dict[str, Any]:
         """Build parameters dictionary from parsed data"""
-        params = {}
-        dims = parsed_data['dimensions']
-        features = parsed_data['features']
-        
         # Component-specific parameters
-        component_type = parsed_data['component_type']
+        builder = _COMPONENT_PARAMETERS.get(parsed_data['component_type'])
+        params = builder(parsed_data['dimensions']) if builder else {}
         
-        if component_type == 'gear':
-            params['teeth'] = dims.get('teeth', 20)
-            params['module'] = dims.get('module', 2.0)
-            params['thickness'] = dims.get('thickness', dims.get('height', 10))
-            # Calculate pitch diameter
-            params['pitch_diameter'] = params['module'] * params['teeth']
-            
-        elif component_type == 'shaft':
-            params['diameter'] = dims.get('diameter', dims.get('width', 20))
-            params['length'] = dims.get('length', 100)
-            
-        elif component_type == 'bracket':
-            params['width'] = dims.get('width', 50)
-            params['height'] = dims.get('height', 30)
-            params['thickness'] = dims.get('thickness', dims.get('depth', 10))
-            
         # Add feature parameters
-        for feature in features:
-            if feature['type'] == 'hole':
-                params.setdefault('holes', []).append({
-                    'diameter': feature['diameter'],
-                    'position': feature['position']
-                })
-            elif feature['type'] == 'fillet':
-                params['fillet_radius'] = feature['radius']
-            elif feature['type'] == 'chamfer':
-                params['chamfer_length'] = feature['length']
+        for feature in parsed_data['features']:
+            apply = _FEATURE_APPLIERS.get(feature['type'])
+            if apply:
+                apply(params, feature)
         
         return params
 
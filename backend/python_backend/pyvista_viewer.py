@@ -4,72 +4,212 @@ Real-time 3D visualization with SolidWorks-like interface
 """
 import pyvista as pv
 import numpy as np
-from typing import Optional, Tuple, List, Dict, Any
+from typing import Callable, Optional, Tuple, List, Dict, Any
 import asyncio
 import websockets
 import json
 import threading
+import functools
 import io
 import base64
-from cadquery import Assembly, Workplane
+from concurrent.futures import ThreadPoolExecutor
+from PIL import Image
+from cadquery import Assembly, Shape, Workplane
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Most responses coalesced into one outbound WebSocket frame
+_MAX_BATCH = 32
+
+# Placeholder feature tree served to every feature_tree request; shared, never mutated
+_FEATURE_TREE = {
+    'root': {
+        'name': 'Part1',
+        'type': 'Part',
+        'children': [
+            {
+                'name': 'Sketch1',
+                'type': 'Sketch',
+                'parameters': {}
+            },
+            {
+                'name': 'Extrude1',
+                'type': 'Extrude',
+                'parameters': {}
+            }
+        ]
+    }
+}
+
+@functools.lru_cache(maxsize=None)
+def _error_png(width: int, height: int) -> bytes:
+    """Grey frame with a red cross, PNG-encoded once per size"""
+    error_img = np.full((height, width, 3), 200, dtype=np.uint8)
+    t = np.linspace(0.0, 1.0, max(width, height))
+    xs = np.rint(50 + t * (width - 100)).astype(int)
+    ys = np.rint(50 + t * (height - 100)).astype(int)
+    # Both diagonals, 5 px thick
+    for offset_y in range(-2, 3):
+        rows = np.clip(ys + offset_y, 0, height - 1)
+        for offset_x in range(-2, 3):
+            error_img[rows, np.clip(xs + offset_x, 0, width - 1)] = (255, 0, 0)
+            error_img[rows, np.clip(width - 1 - xs + offset_x, 0, width - 1)] = (255, 0, 0)
+    
+    img_buffer = io.BytesIO()
+    Image.fromarray(error_img).save(img_buffer, format='PNG')
+    return img_buffer.getvalue()
+
+def _dumps(message: Any) -> str:
+    """Encode a WebSocket text frame, with orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(message, option=orjson.OPT_SERIALIZE_NUMPY).decode('utf-8')
+    return json.dumps(message)
+
+def _loads(message):
+    """Decode a WebSocket frame; orjson's decode error is a json.JSONDecodeError"""
+    if orjson is not None:
+        return orjson.loads(message)
+    return json.loads(message)
+
+def _mesh_from_shape(shape: Shape) -> pv.PolyData:
+    """OpenCascade shape (solid, compound, ...)"""
+    return pv.wrap(shape.toVtkPolyData())
+
+def _mesh_from_workplane(workplane: Workplane) -> Optional[pv.PolyData]:
+    """CadQuery workplane: mesh its first solid"""
+    shapes = workplane.vals()
+    if shapes and isinstance(shapes[0], Shape):
+        return _mesh_from_shape(shapes[0])
+    return None
+
+def _mesh_from_assembly(assembly: Assembly) -> Optional[pv.PolyData]:
+    """CadQuery assembly; would need to extract individual parts"""
+    return None
+
+# Mesh converter per model type; subclasses are resolved through the MRO on first sight
+_MESH_CONVERTERS: Dict[type, Optional[Callable[[Any], Optional[pv.PolyData]]]] = {
+    Shape: _mesh_from_shape,
+    Workplane: _mesh_from_workplane,
+    Assembly: _mesh_from_assembly,
+}
+
+def _mesh_converter(model_type: type) -> Optional[Callable[[Any], Optional[pv.PolyData]]]:
+    """Look up the converter for model_type, caching the MRO walk for subclasses"""
+    try:
+        return _MESH_CONVERTERS[model_type]
+    except KeyError:
+        pass
+    converter = next((_MESH_CONVERTERS[base] for base in model_type.__mro__[1:]
+                      if base in _MESH_CONVERTERS), None)
+    if converter is None and callable(getattr(model_type, 'toVtkPolyData', None)):
+        # Other objects exposing the OpenCascade VTK export
+        converter = _mesh_from_shape
+    _MESH_CONVERTERS[model_type] = converter
+    return converter
 
 class PyVistaRenderer:
     """PyVista-based 3D renderer for CAD models"""
     
-    def __init__(self, width: int = 800, height: int = 600):
+    def __init__(self, width: int = 800, height: int = 600, warm_up: bool = True):
+        """
+        warm_up creates the plotter now instead of on the first frame. Pass False when
+        rendering will happen on another thread, and call warm_up() there.
+        """
         self.width = width
         self.height = height
         self.plotter = None
         self.mesh = None
         self.camera_position = None
+        # Last camera set by _setup_camera, the only place the camera moves; kept so
+        # camera queries don't call into VTK or touch the plotter off its render thread
+        self.camera_state: Dict[str, Tuple[float, float, float]] = {
+            'position': (0, 0, 100),
+            'focal_point': (0, 0, 0),
+            'view_up': (0, 0, 1)
+        }
+        # Model and display options the plotter's actors were built from; the model
+        # reference is held so its id can't be reused by a different object
+        self._scene_model = None
+        self._scene_options = None
+        # Origin marker shared by every centerline render
+        self._origin_sphere = pv.Sphere(radius=2, center=(0, 0, 0))
+        if warm_up:
+            self.warm_up()
         
     def setup_plotter(self):
         """Initialize the PyVista plotter"""
         if self.plotter is None:
             self.plotter = pv.Plotter(window_size=(self.width, self.height), off_screen=True)
             self.plotter.set_background('white')
+    
+    def warm_up(self):
+        """
+        Create the plotter and draw a throwaway cube, so the offscreen GL context and
+        shaders are ready before the first real frame
+        """
+        self.setup_plotter()
+        self.plotter.add_mesh(pv.Cube())
+        self.plotter.render()
+        self.plotter.clear()
             
     def render_cad_model(self, model: Any, color: str = 'lightblue', 
-                        show_edges: bool = True, show_centerline: bool = True) -> str:
+                        show_edges: bool = True, show_centerline: bool = True,
+                        image_format: str = 'png') -> str:
         """
-        Render a CAD model with optional centerline and return base64 encoded image
+        Render a CAD model with optional centerline and return base64 encoded image.
+        image_format is 'png' (default) or 'jpeg' (smaller, lossy; for slow links).
         """
+        image = self.render_image(model, color, show_edges, show_centerline, image_format)
+        return base64.b64encode(image).decode('utf-8')
+    
+    def render_image(self, model: Any, color: str = 'lightblue', 
+                     show_edges: bool = True, show_centerline: bool = True,
+                     image_format: str = 'png') -> bytes:
+        """Render a CAD model like render_cad_model, returning the encoded image bytes"""
         self.setup_plotter()
         
         try:
-            # Convert CAD model to mesh
-            mesh = self._cad_to_mesh(model)
+            options = (color, show_edges, show_centerline)
+            if model is self._scene_model and options == self._scene_options:
+                # Same model and options: the plotter already holds its actors
+                mesh = self.mesh
+            else:
+                # Convert CAD model to mesh
+                mesh = self._cad_to_mesh(model)
+            
+                if mesh:
+                    # Clear previous actors
+                    self._scene_model = None
+                    self.plotter.clear()
+                    
+                    # Add the mesh
+                    self.plotter.add_mesh(
+                        mesh, 
+                        color=color,
+                        show_edges=show_edges,
+                        edge_color='black',
+                        line_width=1
+                    )
+                    
+                    # Add centerline if available
+                    if show_centerline and hasattr(model, 'centerline'):
+                        self._render_centerline(model.centerline, mesh)
+                    
+                    self.mesh = mesh
+                    self._scene_model = model
+                    self._scene_options = options
             
             if mesh:
-                # Clear previous actors
-                self.plotter.clear()
-                
-                # Add the mesh
-                self.plotter.add_mesh(
-                    mesh, 
-                    color=color,
-                    show_edges=show_edges,
-                    edge_color='black',
-                    line_width=1
-                )
-                
-                # Add centerline if available
-                if show_centerline and hasattr(model, 'centerline'):
-                    self._render_centerline(model.centerline, mesh)
-                
                 # Set up camera for isometric view
                 self._setup_camera(mesh)
                 
                 # Render to image
                 image = self.plotter.screenshot(return_img=True)
                 
-                # Convert to base64 for web transmission
-                img_buffer = io.BytesIO()
-                pv.write_array(image, img_buffer, 'png')
-                img_buffer.seek(0)
-                base64_image = base64.b64encode(img_buffer.read()).decode('utf-8')
-                
-                return base64_image
+                return self._encode_image(image, image_format)
                 
         except Exception as e:
             print(f"Rendering error: {e}")
@@ -77,48 +217,65 @@ class PyVistaRenderer:
         
         return self._get_error_image()
     
+    def _encode_image(self, image: np.ndarray, image_format: str = 'png') -> bytes:
+        """Encode an RGB screenshot; PNG uses fast deflate, JPEG quality 75"""
+        img_buffer = io.BytesIO()
+        if image_format == 'jpeg':
+            Image.fromarray(image).save(img_buffer, format='JPEG', quality=75)
+        else:
+            Image.fromarray(image).save(img_buffer, format='PNG', compress_level=1)
+        return img_buffer.getvalue()
+    
     def _render_centerline(self, centerline: Any, mesh: pv.PolyData):
-        """Render centerline/reference axes on the model"""
+        """Render centerline/reference axes on the model, one line mesh per style"""
         try:
-            axes_data = centerline.get_axes_data()
+            starts, ends, colors, styles = centerline.get_axes_arrays()
+            count = len(starts)
+            if not count:
+                return
             
-            for axis_name, axis_info in axes_data.items():
-                start = np.array(axis_info['start'])
-                end = np.array(axis_info['end'])
-                color = axis_info.get('color', 'red')
-                style = axis_info.get('style', 'solid')
-                
-                # Create line
-                line = pv.Line(start, end)
-                
-                # Add line to plotter with style
+            # All axes as one polydata: points are starts then ends, cell i joins i and i + count
+            index = np.arange(count)
+            lines = pv.PolyData(np.vstack((starts, ends)),
+                                lines=np.column_stack((np.full(count, 2), index, index + count)).ravel())
+            lines.cell_data['colors'] = np.array([pv.Color(color).int_rgb for color in colors], dtype=np.uint8)
+            styles = np.array(styles)
+            unique_styles = np.unique(styles)
+            
+            for style in unique_styles:
+                # Line width and tubes are per actor, so each style gets its own sub-mesh
+                if len(unique_styles) == 1:
+                    style_lines = lines
+                else:
+                    style_lines = lines.extract_cells(np.flatnonzero(styles == style))
                 if style == 'dashed':
                     # Dashed line representation
                     self.plotter.add_mesh(
-                        line,
-                        color=color,
+                        style_lines,
+                        scalars='colors',
+                        rgb=True,
                         line_width=2,
-                        label=f'{axis_name}-axis (centerline)',
+                        label='Centerline',
                         render_lines_as_tubes=True
                     )
                 else:
                     # Solid line
                     self.plotter.add_mesh(
-                        line,
-                        color=color,
+                        style_lines,
+                        scalars='colors',
+                        rgb=True,
                         line_width=1.5,
-                        label=f'{axis_name}-axis',
+                        label='Reference axes',
                         render_lines_as_tubes=False
                     )
-                
-                # Add small sphere at origin
-                origin_sphere = pv.Sphere(radius=2, center=(0, 0, 0))
-                self.plotter.add_mesh(
-                    origin_sphere,
-                    color='black',
-                    opacity=0.8,
-                    label='Origin (0, 0, 0)'
-                )
+            
+            # Add small sphere at origin
+            self.plotter.add_mesh(
+                self._origin_sphere,
+                color='black',
+                opacity=0.8,
+                label='Origin (0, 0, 0)'
+            )
                 
         except Exception as e:
             print(f"Error rendering centerline: {e}")
@@ -126,24 +283,9 @@ class PyVistaRenderer:
     def _cad_to_mesh(self, model: Any) -> Optional[pv.PolyData]:
         """Convert CAD model to PyVista mesh"""
         try:
-            # Handle different CAD model types
-            if hasattr(model, 'toVtkPolyData'):
-                # OpenCascade model
-                vtk_data = model.toVtkPolyData()
-                return pv.wrap(vtk_data)
-            elif hasattr(model, 'vals'):
-                # CadQuery model
-                shapes = model.vals()
-                if shapes:
-                    # Get the first solid
-                    solid = shapes[0]
-                    if hasattr(solid, 'toVtkPolyData'):
-                        vtk_data = solid.toVtkPolyData()
-                        return pv.wrap(vtk_data)
-            elif isinstance(model, Assembly):
-                # CadQuery assembly
-                # This is more complex - would need to extract individual parts
-                pass
+            converter = _mesh_converter(type(model))
+            if converter is not None:
+                return converter(model)
                 
         except Exception as e:
             print(f"CAD to mesh conversion error: {e}")
@@ -171,21 +313,15 @@ class PyVistaRenderer:
         self.plotter.camera.focal_point = center
         self.plotter.camera.up = [0, 0, 1]
         self.plotter.camera.zoom(1.0)
+        self.camera_state = {
+            'position': tuple(camera_position),
+            'focal_point': tuple(center),
+            'view_up': (0, 0, 1)
+        }
     
-    def _get_error_image(self) -> str:
+    def _get_error_image(self) -> bytes:
         """Generate error image when rendering fails"""
-        # Create simple error image
-        error_img = np.ones((self.height, self.width, 3), dtype=np.uint8) * 200
-        # Add red cross
-        cv2 = __import__('cv2')  # Import only if needed
-        cv2.line(error_img, (50, 50), (self.width-50, self.height-50), (0, 0, 255), 5)
-        cv2.line(error_img, (self.width-50, 50), (50, self.height-50), (0, 0, 255), 5)
-        
-        img_buffer = io.BytesIO()
-        import PIL.Image as Image
-        Image.fromarray(error_img).save(img_buffer, format='PNG')
-        img_buffer.seek(0)
-        return base64.b64encode(img_buffer.read()).decode('utf-8')
+        return _error_png(self.width, self.height)
     
     def close(self):
         """Clean up resources"""
@@ -195,39 +331,129 @@ class PyVistaRenderer:
 class RealTimeViewer:
     """Real-time 3D viewer with WebSocket communication"""
     
-    def __init__(self, host: str = 'localhost', port: int = 8765):
+    def __init__(self, host: str = 'localhost', port: int = 8765,
+                 renderer: Optional[PyVistaRenderer] = None):
+        """
+        renderer is shared with the caller when given; build it with warm_up=False,
+        since it is warmed up and used on this viewer's render thread
+        """
         self.host = host
         self.port = port
-        self.renderer = PyVistaRenderer()
+        self.renderer = renderer if renderer is not None else PyVistaRenderer(warm_up=False)
         self.current_model = None
         self.websocket_server = None
+        # Renders run here, off the event loop; one worker because the plotter and
+        # its GL context must stay on a single thread
+        self._render_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix='pyvista-render')
+        self._render_pool.submit(self.renderer.warm_up)
         
     async def handle_client(self, websocket, path):
-        """Handle WebSocket client connections"""
+        """
+        Handle WebSocket client connections. Responses are queued and sent by a
+        per-connection task; see _drain_outbox for how they are batched.
+        
+        Render requests go to their own worker so they don't hold up other messages.
+        At most one waits behind the frame being rendered: a newer request replaces
+        it, and the superseded one gets no reply.
+        """
         print(f"Client connected: {websocket.remote_address}")
+        outbox = asyncio.Queue()
+        render_requests = asyncio.Queue(maxsize=1)
+        sender = asyncio.ensure_future(self._drain_outbox(websocket, outbox))
+        render_worker = asyncio.ensure_future(self._render_worker(render_requests, outbox))
         
         try:
             async for message in websocket:
                 try:
-                    data = json.loads(message)
+                    data = _loads(message)
+                    if data.get('type') == 'render_request':
+                        if render_requests.full():
+                            render_requests.get_nowait()  # stale; the newest request wins
+                        render_requests.put_nowait(data)
+                        continue
                     response = await self.process_message(data, websocket)
                     if response:
-                        await websocket.send(json.dumps(response))
+                        outbox.put_nowait(response)
                 except json.JSONDecodeError:
-                    await websocket.send(json.dumps({
+                    outbox.put_nowait({
                         'type': 'error',
                         'message': 'Invalid JSON message'
-                    }))
+                    })
                 except Exception as e:
-                    await websocket.send(json.dumps({
+                    outbox.put_nowait({
                         'type': 'error',
                         'message': f'Processing error: {str(e)}'
-                    }))
+                    })
                     
         except websockets.exceptions.ConnectionClosed:
             print(f"Client disconnected: {websocket.remote_address}")
         except Exception as e:
             print(f"WebSocket error: {e}")
+        finally:
+            render_worker.cancel()
+            sender.cancel()
+    
+    async def _render_worker(self, render_requests: asyncio.Queue, outbox: asyncio.Queue):
+        """Serve one connection's render requests in order, one frame at a time"""
+        while True:
+            data = await render_requests.get()
+            outbox.put_nowait(await self.handle_render_request(data))
+    
+    async def _drain_outbox(self, websocket, outbox: asyncio.Queue):
+        """
+        Send queued responses in order. JSON responses that piled up while the previous
+        send was in flight go out together as one {'type': 'batch', 'batch': [...]}
+        frame; a lone response is sent as is, so nothing waits on a batching timer.
+        A response that fails to encode or send is reported and skipped; only a
+        closed connection stops the sender.
+        """
+        try:
+            while True:
+                pending = [await outbox.get()]
+                while not outbox.empty() and len(pending) < _MAX_BATCH:
+                    pending.append(outbox.get_nowait())
+                
+                batch = []
+                for response in pending:
+                    if isinstance(response.get('image'), bytes):
+                        await self._send_json(websocket, batch)
+                        batch = []
+                        # Binary render result: JSON header, then the raw image frame
+                        header = self._encode({key: value for key, value in response.items() if key != 'image'})
+                        await self._send(websocket, header)
+                        await self._send(websocket, response['image'])
+                    else:
+                        batch.append(self._encode(response))
+                await self._send_json(websocket, batch)
+        except websockets.exceptions.ConnectionClosed:
+            pass
+    
+    def _encode(self, response: Dict[str, Any]) -> str:
+        """Encode one response, replacing it with an error response if it can't be encoded"""
+        try:
+            return _dumps(response)
+        except Exception as e:
+            print(f"Response encoding error: {e}")
+            return _dumps({
+                'type': 'error',
+                'message': f'Response encoding error: {str(e)}'
+            })
+    
+    async def _send(self, websocket, frame):
+        """Send one frame; errors other than a closed connection are reported, not raised"""
+        try:
+            await websocket.send(frame)
+        except websockets.exceptions.ConnectionClosed:
+            raise
+        except Exception as e:
+            print(f"WebSocket send error: {e}")
+    
+    async def _send_json(self, websocket, frames: List[str]):
+        """Send encoded JSON responses as a single frame"""
+        if len(frames) == 1:
+            await self._send(websocket, frames[0])
+        elif frames:
+            await self._send(websocket, '{"type":"batch","batch":[' + ','.join(frames) + ']}')
     
     async def process_message(self, data: Dict[str, Any], websocket) -> Optional[Dict[str, Any]]:
         """Process incoming WebSocket messages"""
@@ -285,9 +511,7 @@ class RealTimeViewer:
             # Return current camera state
             return {
                 'type': 'camera_state',
-                'position': self.renderer.plotter.camera.position if self.renderer.plotter else [0, 0, 100],
-                'focal_point': self.renderer.plotter.camera.focal_point if self.renderer.plotter else [0, 0, 0],
-                'view_up': self.renderer.plotter.camera.up if self.renderer.plotter else [0, 0, 1]
+                **self.renderer.camera_state
             }
         except Exception as e:
             return {
@@ -297,47 +521,35 @@ class RealTimeViewer:
     
     async def handle_feature_tree(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Handle feature tree requests"""
-        try:
-            # Return feature tree structure
-            # This would integrate with your CAD engine's feature management
-            feature_tree = {
-                'root': {
-                    'name': 'Part1',
-                    'type': 'Part',
-                    'children': [
-                        {
-                            'name': 'Sketch1',
-                            'type': 'Sketch',
-                            'parameters': {}
-                        },
-                        {
-                            'name': 'Extrude1',
-                            'type': 'Extrude',
-                            'parameters': {}
-                        }
-                    ]
-                }
-            }
-            
-            return {
-                'type': 'feature_tree',
-                'tree': feature_tree
-            }
-        except Exception as e:
-            return {
-                'type': 'error',
-                'message': f'Feature tree error: {str(e)}'
-            }
+        # This would integrate with your CAD engine's feature management
+        return {
+            'type': 'feature_tree',
+            'tree': _FEATURE_TREE
+        }
     
     async def handle_render_request(self, data: Dict[str, Any]) -> Dict[str, Any]:
-        """Handle render requests"""
+        """
+        Handle render requests. With 'binary': true the image is sent as a raw binary
+        frame right after the JSON render_result header instead of inline base64.
+        """
         try:
             if self.current_model:
-                image_data = self.renderer.render_cad_model(self.current_model)
+                image_format = 'jpeg' if data.get('format') == 'jpeg' else 'png'
+                image_data = await asyncio.get_running_loop().run_in_executor(
+                    self._render_pool,
+                    functools.partial(self.renderer.render_image, self.current_model, image_format=image_format))
+                if data.get('binary'):
+                    return {
+                        'type': 'render_result',
+                        'format': image_format,
+                        'binary': True,
+                        'size': len(image_data),
+                        'image': image_data
+                    }
                 return {
                     'type': 'render_result',
-                    'image': image_data,
-                    'format': 'png'
+                    'image': base64.b64encode(image_data).decode('utf-8'),
+                    'format': image_format
                 }
             else:
                 return {
@@ -370,13 +582,23 @@ class RealTimeViewer:
         server_thread = threading.Thread(target=run_server, daemon=True)
         server_thread.start()
         return server_thread
+    
+    def render_model(self, model: Any, **kwargs) -> str:
+        """Render a model on the render thread, blocking until the image is ready"""
+        return self._render_pool.submit(functools.partial(self.renderer.render_cad_model, model, **kwargs)).result()
+    
+    def close(self):
+        """Finish any in-flight render and release the renderer on its own thread"""
+        self._render_pool.submit(self.renderer.close)
+        self._render_pool.shutdown(wait=True)
 
 class CADViewport:
     """Main CAD viewport class for integration with web frontend"""
     
     def __init__(self, width: int = 800, height: int = 600):
-        self.renderer = PyVistaRenderer(width, height)
-        self.viewer = RealTimeViewer()
+        # One renderer, and one GL context, shared with the WebSocket viewer
+        self.renderer = PyVistaRenderer(width, height, warm_up=False)
+        self.viewer = RealTimeViewer(renderer=self.renderer)
         self.server_thread = None
     
     def start_realtime_viewer(self):
@@ -386,7 +608,7 @@ class CADViewport:
     
     def render_model(self, model: Any, **kwargs) -> str:
         """Render a model and return base64 image"""
-        return self.renderer.render_cad_model(model, **kwargs)
+        return self.viewer.render_model(model, **kwargs)
     
     def update_model(self, model: Any):
         """Update the current model"""
@@ -395,16 +617,12 @@ class CADViewport:
     def get_camera_state(self) -> Dict[str, Any]:
         """Get current camera state"""
         if self.renderer.plotter:
-            return {
-                'position': self.renderer.plotter.camera.position,
-                'focal_point': self.renderer.plotter.camera.focal_point,
-                'view_up': self.renderer.plotter.camera.up
-            }
+            return dict(self.renderer.camera_state)
         return {}
     
     def close(self):
-        """Clean up resources"""
-        self.renderer.close()
+        """Clean up resources; the viewer also closes the shared renderer"""
+        self.viewer.close()
 
 # Example usage
 if __name__ == "__main__":
@@ -5,6 +5,8 @@ Verifies all components are working correctly
 import sys
 import os
 import json
+import importlib.util
+import math
 
 # Add python_backend to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'python_backend'))
@@ -14,7 +16,7 @@ def test_cad_engine():
     print("🧪 Testing CAD Engine...")
     
     try:
-        from cad_engine import ParametricEngine, CADModel
+        from cad_engine import ParametricEngine, CADModel, HoleFeature
         from enhanced_nlp import EnhancedNLPParser
         from digiform_cad import DigiformCADEngine
         
@@ -31,7 +33,46 @@ def test_cad_engine():
         assert shaft is not None, "Shaft creation failed"
         print(f"    Shaft volume: {shaft.get_volume():.2f} mm³")
         
-        # Test 3: Enhanced NLP parsing
+        # Test 3: Involute gear geometry
+        print("  ✓ Testing involute gear geometry...")
+        specs = gear.gear_specs
+        assert specs['type'] == 'involute_spur', "Gear is not involute"
+        assert specs['pitch_diameter'] < max(gear.get_bounding_box()[:2]) <= specs['outside_diameter'] + 0.01, "Gear teeth outside pitch/tip circles"
+        bore_area = math.pi * 4 ** 2
+        root_volume = (math.pi * (specs['root_diameter'] / 2) ** 2 - bore_area) * 10
+        tip_volume = (math.pi * (specs['outside_diameter'] / 2) ** 2 - bore_area) * 10
+        assert root_volume < gear.get_volume() < tip_volume, "Gear volume outside root/tip disc bounds"
+        print(f"    Root diameter: {specs['root_diameter']:.2f} mm, base diameter: {specs['base_diameter']:.2f} mm")
+        
+        # Test 4: Mounting holes at absolute positions
+        print("  ✓ Testing hole placement...")
+        bracket = ParametricEngine.create_bracket(40, 20, 5, [(-10, 5, 4), (10, 5, 4)])
+        hole_centers = sorted((round(face.Center().x, 6), round(face.Center().y, 6))
+                              for face in bracket.result.faces('%CYLINDER').vals())
+        assert hole_centers == [(-10, 5), (10, 5)], f"Holes misplaced: {hole_centers}"
+        print(f"    Hole centers: {hole_centers}")
+        
+        # Test 5: Exact mass properties of a 50 x 30 x 10 mm steel box
+        print("  ✓ Testing mass properties...")
+        box = ParametricEngine.create_bracket(50, 30, 10)
+        mass_properties = box.compute_mass_properties()
+        assert abs(mass_properties.mass_kg - 0.11775) < 1e-9, f"Box mass wrong: {mass_properties.mass_kg}"
+        inertia = mass_properties.moments_of_inertia
+        # Ixx = m (b² + c²) / 12 about the center of mass, in kg·mm²
+        assert abs(inertia['Ixx'] - 0.11775 * (30 ** 2 + 10 ** 2) / 12) < 1e-6, f"Box Ixx wrong: {inertia['Ixx']}"
+        assert abs(inertia['Izz'] - 0.11775 * (50 ** 2 + 30 ** 2) / 12) < 1e-6, f"Box Izz wrong: {inertia['Izz']}"
+        surface_area = box.get_metrics()[3]
+        assert abs(surface_area - 4600) < 1e-6, f"Box surface area wrong: {surface_area}"
+        print(f"    Mass: {mass_properties.mass_kg:.5f} kg, Ixx: {inertia['Ixx']:.4f} kg·mm²")
+        
+        # Test 6: Cached models are not changed by callers
+        print("  ✓ Testing model cache isolation...")
+        feature_count = len(shaft.features)
+        shaft.add_feature(HoleFeature("cross_hole", {"diameter": 5}))
+        cached_shaft = ParametricEngine.create_shaft(20, 100)
+        assert len(cached_shaft.features) == feature_count, "Caller's add_feature leaked into the model cache"
+        
+        # Test 7: Enhanced NLP parsing
         print("  ✓ Testing NLP parser...")
         parser = EnhancedNLPParser()
         description = "Create a steel bracket 100mm x 50mm x 10mm with 4 mounting holes 8mm diameter"
@@ -41,7 +82,7 @@ def test_cad_engine():
         print(f"    Parsed component: {parsed['component_type']}")
         print(f"    Dimensions: {parsed['dimensions']}")
         
-        # Test 4: Full CAD engine integration
+        # Test 8: Full CAD engine integration
         print("  ✓ Testing full CAD engine...")
         engine = DigiformCADEngine("test_output")
         result = engine.process_natural_language(
@@ -53,7 +94,7 @@ def test_cad_engine():
         print(f"    Model properties: {result['properties']}")
         print(f"    Features: {len(result['feature_checklist'])} items")
         
-        # Test 5: Export functionality
+        # Test 9: Export functionality
         print("  ✓ Testing export functionality...")
         export_result = engine.export_model('stl', 'test_gear.stl')
         assert export_result['success'], f"Export failed: {export_result.get('error', 'Unknown error')}"
@@ -87,10 +128,10 @@ def test_dependencies():
     missing_packages = []
     
     for package in required_packages:
-        try:
-            __import__(package)
+        # Locate the package without importing it; cadquery and pyvista take seconds to load
+        if importlib.util.find_spec(package) is not None:
             print(f"  ✓ {package}")
-        except ImportError:
+        else:
             print(f"  ❌ {package} - NOT INSTALLED")
             missing_packages.append(package)
     